@@ -4,7 +4,8 @@ import { useState, useEffect, useMemo, useCallback } from 'react'
 import Fuse from 'fuse.js'
 import { NewsCard } from './NewsCard'
 import { NewsArticle } from '../../lib/types'
-import { extractTags } from '../../lib/utils'
+import { countTerms, extractTags, pickTags } from '../../lib/utils'
+import { fetchTermCounts } from '../../lib/api'
 import { ContentContainer, TagContainer, Tag } from '../../lib/styles'
 
 interface HomeClientProps {
@@ -29,9 +30,27 @@ export function HomeClientComponent({
     const [articlesToShow, setArticlesToShow] = useState(20)
 
     useEffect(() => {
-        const allArticles = [...initialNews, ...initialAcademicNews]
-        if (allArticles.length > 0) {
-            setTags(extractTags(allArticles))
+        let cancelled = false
+
+        fetchTermCounts().then(serverCounts => {
+            if (cancelled) return
+            if (serverCounts) {
+                // The API only counts database articles; academic.json is static, so add its terms here
+                const wordFrequency = countTerms(initialAcademicNews)
+                Object.entries(serverCounts).forEach(([word, count]) => {
+                    wordFrequency.set(word, (wordFrequency.get(word) || 0) + count)
+                })
+                setTags(pickTags(wordFrequency))
+                return
+            }
+            const allArticles = [...initialNews, ...initialAcademicNews]
+            if (allArticles.length > 0) {
+                setTags(extractTags(allArticles))
+            }
+        })
+
+        return () => {
+            cancelled = true
         }
     }, [initialNews, initialAcademicNews])
 
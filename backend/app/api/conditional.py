@@ -0,0 +1,36 @@
+import hashlib
+from typing import Hashable, Optional, Tuple
+
+from fastapi import Request
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import news_cache
+from app.models.news import News
+
+NewsVersion = Tuple[int, Optional[int]]
+
+VERSION_CACHE_KEY = ("news_version",)
+
+
+async def get_news_version(db: AsyncSession) -> NewsVersion:
+    version = news_cache.get(VERSION_CACHE_KEY)
+    if version is None:
+        count, max_id = (await db.execute(select(func.count(News.id), func.max(News.id)))).one()
+        version = (count, max_id)
+        news_cache.set(VERSION_CACHE_KEY, version)
+    return version
+
+
+def validator_headers(version: NewsVersion, key: Hashable) -> dict:
+    digest = hashlib.sha1(repr((*version, key)).encode("utf-8")).hexdigest()[:20]
+    return {"ETag": f'"{digest}"', "Cache-Control": "no-cache"}
+
+
+def is_not_modified(request: Request, headers: dict) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is None:
+        return False
+    
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or headers["ETag"] in candidates
@@ -1,62 +1,209 @@
 import logging
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from datetime import UTC, datetime, timedelta
+from typing import List, Literal, Optional, Union
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.conditional import get_news_version, is_not_modified, validator_headers
+from app.api.pagination import decode_cursor, decode_rank_cursor, encode_cursor, encode_rank_cursor
+from app.api.search import build_search_query, highlight_terms, search_terms
+from app.api.serialization import dump_json, dump_news_row, dump_news_rows, select_news_rows
+from app.core.cache import news_cache
 from app.core.database import get_db
-from app.models.news import News
-from app.schemas.news import NewsResponse
-from app.services.news_fetcher import fetch_and_save_news
-from app.services.scheduler import export_news_to_json
+from app.models.news import News, NewsTermStat
+from app.schemas.jobs import FetchJob
+from app.schemas.news import NewsCompactResponse, NewsResponse, NewsSearchResult, NewsTags
+from app.services.jobs import fetch_jobs
+from app.services.tags import pick_tags
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 
-@router.get("/news", response_model=List[NewsResponse])
-def get_news(
+def _json_response(content: bytes, headers: dict) -> Response:
+    return Response(content=content, media_type="application/json", headers=headers)
+
+
+@router.get("/news", response_model=Union[List[NewsResponse], List[NewsCompactResponse]])
+async def get_news(
+    request: Request,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     source: Optional[str] = None,
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None,
+    view: Literal["full", "compact"] = "full",
+    db: AsyncSession = Depends(get_db)
 ):
-    query = db.query(News)
+    position = decode_cursor(cursor) if cursor else None
+    
+    version = await get_news_version(db)
+    cache_key = ("news", skip, limit, source, cursor, view, version)
+    validators = validator_headers(version, cache_key[:-1])
+    if is_not_modified(request, validators):
+        return Response(status_code=304, headers=validators)
+    
+    cached = news_cache.get(cache_key)
+    if cached:
+        return _json_response(*cached)
+    
+    query = select_news_rows(view)
     
     if source:
-        query = query.filter(News.source == source)
+        query = query.where(News.source == source)
+    
+    if position:
+        query = query.where(tuple_(News.created_at, News.id) < tuple_(*position))
+        skip = 0
     
-    news_items = query.order_by(News.created_at.desc()).offset(skip).limit(limit).all()
-    return news_items
+    query = query.order_by(News.created_at.desc(), News.id.desc())
+    news_items = (await db.execute(query.offset(skip).limit(limit + 1))).all()
+    
+    headers = dict(validators)
+    if len(news_items) > limit:
+        news_items = news_items[:limit]
+        last = news_items[-1]
+        headers["X-Next-Cursor"] = encode_cursor(last.created_at, last.id)
+    
+    content = dump_news_rows(news_items)
+    news_cache.set(cache_key, (content, headers))
+    return _json_response(content, headers)
 
 
-@router.get("/news/{news_id}", response_model=NewsResponse)
-def get_news_by_id(news_id: int, db: Session = Depends(get_db)):
-    news = db.query(News).filter(News.id == news_id).first()
+@router.get("/news/search", response_model=List[NewsSearchResult])
+async def search_news(
+    request: Request,
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    source: Optional[str] = None,
+    sort: Literal["relevance", "newest"] = "relevance",
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_db)
+):
+    position = None
+    if cursor:
+        position = decode_rank_cursor(cursor) if sort == "relevance" else decode_cursor(cursor)
     
-    if not news:
-        raise HTTPException(status_code=404, detail="News item not found")
+    version = await get_news_version(db)
+    cache_key = ("news_search", q, limit, source, sort, cursor, version)
+    validators = validator_headers(version, cache_key[:-1])
+    if is_not_modified(request, validators):
+        return Response(status_code=304, headers=validators)
     
-    return news
+    cached = news_cache.get(cache_key)
+    if cached:
+        return _json_response(*cached)
+    
+    dialect = db.get_bind().dialect.name
+    query, rank = build_search_query(dialect, q)
+    
+    if source:
+        query = query.where(News.source == source)
+    
+    if sort == "relevance":
+        if position:
+            query = query.where(tuple_(rank, News.id) < tuple_(*position))
+        query = query.order_by(rank.desc(), News.id.desc())
+    else:
+        if position:
+            query = query.where(tuple_(News.created_at, News.id) < tuple_(*position))
+        query = query.order_by(News.created_at.desc(), News.id.desc())
+    
+    results = (await db.execute(query.limit(limit + 1))).all()
+    
+    headers = dict(validators)
+    if len(results) > limit:
+        results = results[:limit]
+        last = results[-1]
+        if sort == "relevance":
+            headers["X-Next-Cursor"] = encode_rank_cursor(last.rank, last.id)
+        else:
+            headers["X-Next-Cursor"] = encode_cursor(last.created_at, last.id)
+    
+    items = [row._asdict() for row in results]
+    if dialect != "postgresql":
+        terms = search_terms(q)
+        for item in items:
+            item["highlight"] = highlight_terms(item["summary"], terms)
+    
+    content = dump_json(items)
+    news_cache.set(cache_key, (content, headers))
+    return _json_response(content, headers)
 
 
-@router.post("/fetch-news")
-async def trigger_news_fetch(db: Session = Depends(get_db)):
-    try:
-        logger.info("Manual news fetch triggered")
-        saved, duplicates = await fetch_and_save_news(db)
+@router.get("/news/tags", response_model=NewsTags)
+async def get_news_tags(
+    request: Request,
+    days: Optional[int] = Query(None, ge=1, le=3650),
+    source: Optional[str] = None,
+    db: AsyncSession = Depends(get_db)
+):
+    version = await get_news_version(db)
+    cache_key = ("news_tags", days, source, version)
+    validators = validator_headers(version, cache_key[:-1])
+    if is_not_modified(request, validators):
+        return Response(status_code=304, headers=validators)
+    
+    cached = news_cache.get(cache_key)
+    if cached:
+        return _json_response(*cached)
+    
+    query = select(NewsTermStat.term, func.sum(NewsTermStat.count)).group_by(NewsTermStat.term)
+    
+    if days:
+        query = query.where(NewsTermStat.day > datetime.now(UTC).date() - timedelta(days=days))
+    
+    if source:
+        query = query.where(NewsTermStat.source == source)
+    
+    frequencies = dict((await db.execute(query)).tuples().all())
+    tags = pick_tags(list(frequencies.items()))
+    
+    content = dump_json({"tags": tags, "counts": frequencies})
+    news_cache.set(cache_key, (content, validators))
+    return _json_response(content, validators)
+
+
+@router.get("/news/{news_id}", response_model=NewsResponse)
+async def get_news_by_id(news_id: int, request: Request, db: AsyncSession = Depends(get_db)):
+    version = await get_news_version(db)
+    cache_key = ("news_item", news_id, version)
+    validators = validator_headers(version, cache_key[:-1])
+    
+    cached = news_cache.get(cache_key)
+    if not cached:
+        news = (await db.execute(select_news_rows().where(News.id == news_id))).first()
         
-        export_news_to_json(db)
+        if not news:
+            raise HTTPException(status_code=404, detail="News item not found")
         
-        return {
-            "status": "success",
-            "saved": saved,
-            "duplicates": duplicates,
-            "message": f"Fetched news: {saved} new items, {duplicates} duplicates"
-        }
-    except Exception as e:
-        logger.error(f"Error in manual fetch: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        cached = (dump_news_row(news), validators)
+        news_cache.set(cache_key, cached)
+    
+    if is_not_modified(request, validators):
+        return Response(status_code=304, headers=validators)
+    return _json_response(*cached)
+
+
+@router.post("/fetch-news", response_model=FetchJob, status_code=202)
+async def trigger_news_fetch(response: Response):
+    job, created = fetch_jobs.submit("manual")
+    if created:
+        logger.info("Manual news fetch triggered")
+    
+    response.headers["Location"] = f"/api/fetch-news/{job.job_id}"
+    return job
+
+
+@router.get("/fetch-news/{job_id}", response_model=FetchJob)
+async def get_news_fetch_job(job_id: str):
+    job = fetch_jobs.get(job_id)
+    
+    if not job:
+        raise HTTPException(status_code=404, detail="Fetch job not found")
+    
+    return job
 
 
 @router.get("/health")
@@ -0,0 +1,62 @@
+import re
+from typing import List
+
+from sqlalchemy import Float, case, func, literal, literal_column, or_, select
+
+from app.api.serialization import NEWS_VIEW_COLUMNS, select_news_rows
+from app.models.news import News
+
+SEARCH_CONFIG = "english"
+HEADLINE_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MaxWords=35, MinWords=15, MaxFragments=2"
+MAX_SEARCH_TERMS = 10
+TOKEN_PATTERN = re.compile(r"\w+")
+
+search_vector = literal_column("news.search_vector")
+
+
+def search_terms(q: str) -> List[str]:
+    return list(dict.fromkeys(TOKEN_PATTERN.findall(q.lower())))[:MAX_SEARCH_TERMS]
+
+
+def build_search_query(dialect: str, q: str):
+    if dialect == "postgresql":
+        tsquery = func.websearch_to_tsquery(SEARCH_CONFIG, q)
+        rank = func.ts_rank(search_vector, tsquery, type_=Float)
+        highlight = func.ts_headline(SEARCH_CONFIG, News.summary, tsquery, HEADLINE_OPTIONS)
+        query = select_news_rows("compact").add_columns(rank.label("rank"), highlight.label("highlight"))
+        return query.where(search_vector.op("@@")(tsquery)), rank
+    
+    return _build_like_query(search_terms(q))
+
+
+def _build_like_query(terms: List[str]):
+    fields = [(News.title, 3), (News.summary, 2), (News.body, 1)]
+    rank = literal(0)
+    conditions = []
+    
+    for term in terms:
+        pattern = f"%{_escape_like(term)}%"
+        matches = [(column.ilike(pattern, escape="\\"), weight) for column, weight in fields]
+        conditions.append(or_(*(match for match, _ in matches)))
+        for match, weight in matches:
+            rank = rank + case((match, weight), else_=0)
+    
+    query = select(*NEWS_VIEW_COLUMNS["compact"], rank.label("rank"), literal(None).label("highlight"))
+    if not terms:
+        return query.where(literal(False)), rank
+    return query.where(*conditions), rank
+
+
+def highlight_terms(text: str, terms: List[str], max_length: int = 240) -> str:
+    if not terms:
+        return text[:max_length]
+    
+    pattern = re.compile("|".join(re.escape(term) for term in terms), re.IGNORECASE)
+    first = pattern.search(text)
+    start = max(0, first.start() - max_length // 4) if first else 0
+    snippet = text[start:start + max_length]
+    return ("…" if start else "") + pattern.sub(lambda match: f"<mark>{match.group(0)}</mark>", snippet)
+
+
+def _escape_like(term: str) -> str:
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
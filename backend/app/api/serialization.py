@@ -0,0 +1,32 @@
+from typing import Iterable
+
+import orjson
+from sqlalchemy import select
+
+from app.core.profiling import timed
+from app.models.news import News
+from app.schemas.news import NewsCompactResponse, NewsResponse
+
+NEWS_VIEW_COLUMNS = {
+    "full": [getattr(News, name) for name in NewsResponse.model_fields],
+    "compact": [getattr(News, name) for name in NewsCompactResponse.model_fields],
+}
+
+
+def select_news_rows(view: str = "full"):
+    return select(*NEWS_VIEW_COLUMNS[view])
+
+
+def dump_news_rows(rows: Iterable) -> bytes:
+    with timed("serialize"):
+        return orjson.dumps([row._asdict() for row in rows], option=orjson.OPT_UTC_Z)
+
+
+def dump_news_row(row) -> bytes:
+    with timed("serialize"):
+        return orjson.dumps(row._asdict(), option=orjson.OPT_UTC_Z)
+
+
+def dump_json(data) -> bytes:
+    with timed("serialize"):
+        return orjson.dumps(data, option=orjson.OPT_UTC_Z)
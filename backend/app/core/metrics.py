@@ -0,0 +1,107 @@
+import time
+from contextlib import contextmanager
+
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, Counter, Gauge, Histogram, generate_latest
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Time spent handling HTTP requests",
+    ["method", "route", "status"],
+)
+
+SERPER_REQUEST_DURATION = Histogram(
+    "serper_request_duration_seconds",
+    "Latency of Serper search requests",
+    ["query", "status"],
+)
+
+NEWS_ITEMS = Counter(
+    "news_items_total",
+    "News items handled by the ingest pipeline",
+    ["outcome"],
+)
+
+INGEST_STAGE_DURATION = Histogram(
+    "news_ingest_stage_duration_seconds",
+    "Time spent in each stage of fetch_and_save_news",
+    ["stage"],
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300),
+)
+
+EXPORT_DURATION = Histogram(
+    "news_export_duration_seconds",
+    "Time spent exporting the news snapshot",
+    ["mode"],
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120),
+)
+
+EXPORT_BYTES = Counter(
+    "news_export_bytes_total",
+    "Bytes written by news snapshot exports",
+)
+
+EXPORT_LAST_BYTES = Gauge(
+    "news_export_last_bytes",
+    "Bytes written by the most recent news snapshot export",
+)
+
+DB_STATEMENT_DURATION = Histogram(
+    "db_statement_duration_seconds",
+    "Time spent executing SQL statements",
+    ["scope"],
+)
+
+DB_STATEMENTS_PER_REQUEST = Histogram(
+    "db_statements_per_request",
+    "SQL statements executed while handling an HTTP request",
+    ["route"],
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100),
+)
+
+FETCH_LAST_SUCCESS = Gauge(
+    "news_fetch_last_success_timestamp_seconds",
+    "Unix time of the last successful fetch job",
+    ["trigger"],
+)
+
+
+@contextmanager
+def observe_duration(histogram: Histogram, **labels):
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        histogram.labels(**labels).observe(time.perf_counter() - started)
+
+
+def render_metrics() -> tuple:
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+
+
+class MetricsMiddleware:
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        status = 500
+        
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+        
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            HTTP_REQUEST_DURATION.labels(
+                method=scope["method"],
+                route=route.path if route is not None else "unmatched",
+                status=str(status),
+            ).observe(time.perf_counter() - started)
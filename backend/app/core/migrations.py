@@ -0,0 +1,72 @@
+import logging
+from pathlib import Path
+
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from sqlalchemy import inspect, text
+
+from app.core.database import Base, engine
+from app.models import news  # noqa: F401
+
+logger = logging.getLogger(__name__)
+
+ALEMBIC_INI = Path(__file__).resolve().parents[2] / "alembic.ini"
+BASELINE_REVISION = "0001"
+UNMAPPED_COLUMNS = {("news", "search_vector")}
+UNMAPPED_INDEXES = {"ix_news_search_vector"}
+
+SEARCH_VECTOR_DDL = [
+    """
+    ALTER TABLE news ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(summary, '')), 'B') ||
+        setweight(to_tsvector('english', coalesce(body, '')), 'C')
+    ) STORED
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_news_search_vector ON news USING gin (search_vector)",
+]
+
+
+def get_alembic_config(connection=None) -> Config:
+    config = Config(str(ALEMBIC_INI))
+    config.attributes["configure_logger"] = False
+    if connection is not None:
+        config.attributes["connection"] = connection
+    return config
+
+
+def include_object(obj, name, type_, reflected, compare_to) -> bool:
+    if type_ == "column":
+        return (obj.table.name, name) not in UNMAPPED_COLUMNS
+    if type_ == "index":
+        return name not in UNMAPPED_INDEXES
+    return True
+
+
+def schema_differences(connection) -> list:
+    context = MigrationContext.configure(connection, opts={"include_object": include_object})
+    return compare_metadata(context, Base.metadata)
+
+
+def create_unmapped_objects(connection):
+    if connection.dialect.name == "postgresql":
+        for statement in SEARCH_VECTOR_DDL:
+            connection.execute(text(statement))
+
+
+def run_migrations(bind=engine):
+    with bind.begin() as connection:
+        config = get_alembic_config(connection)
+        tables = inspect(connection).get_table_names()
+        
+        if "news" in tables and "alembic_version" not in tables:
+            revision = "head" if not schema_differences(connection) else BASELINE_REVISION
+            logger.info(f"Existing schema without migration history, stamping revision {revision}")
+            if revision == "head":
+                create_unmapped_objects(connection)
+            command.stamp(config, revision)
+        
+        command.upgrade(config, "head")
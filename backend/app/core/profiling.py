@@ -0,0 +1,128 @@
+import asyncio
+import cProfile
+import logging
+import re
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Dict, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+SERVER_TIMING_STAGES = ("db", "serialize")
+
+_timings: ContextVar[Optional[Dict[str, float]]] = ContextVar("request_timings", default=None)
+
+
+def record_timing(name: str, seconds: float):
+    timings = _timings.get()
+    if timings is not None:
+        timings[name] = timings.get(name, 0.0) + seconds
+
+
+@contextmanager
+def timed(name: str):
+    if _timings.get() is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_timing(name, time.perf_counter() - started)
+
+
+def server_timing_header(timings: Dict[str, float], total: float) -> str:
+    stages = [f"{name};dur={timings.get(name, 0.0) * 1000:.1f}" for name in SERVER_TIMING_STAGES]
+    return ", ".join([*stages, f"total;dur={total * 1000:.1f}"])
+
+
+def profile_path(directory: Path, method: str, path: str, total: float) -> Path:
+    slug = re.sub(r"[^A-Za-z0-9]+", "-", path).strip("-") or "root"
+    stamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%S%f")
+    return directory / f"{stamp}-{method.lower()}-{slug}-{total * 1000:.0f}ms.prof"
+
+
+# Enables the profiler only while the wrapped coroutine is stepping, so other tasks
+# interleaved on the event loop stay out of the profile.
+class ProfiledSteps:
+    def __init__(self, coro, profiler: cProfile.Profile):
+        self.coro = coro
+        self.profiler = profiler
+    
+    def __await__(self):
+        return self
+    
+    def __iter__(self):
+        return self
+    
+    def __next__(self):
+        return self.send(None)
+    
+    def send(self, value):
+        return self._step(self.coro.send, value)
+    
+    def throw(self, *args):
+        return self._step(self.coro.throw, *args)
+    
+    def close(self):
+        self.coro.close()
+    
+    def _step(self, method, *args):
+        try:
+            self.profiler.enable()
+        except ValueError:
+            return method(*args)
+        try:
+            return method(*args)
+        finally:
+            self.profiler.disable()
+
+
+class ProfilingMiddleware:
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self._enabled(scope):
+            await self.app(scope, receive, send)
+            return
+        
+        timings: Dict[str, float] = {}
+        token = _timings.set(timings)
+        started = time.perf_counter()
+        
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                header = server_timing_header(timings, time.perf_counter() - started)
+                message["headers"] = [*message.get("headers", []), (b"server-timing", header.encode("latin-1"))]
+            await send(message)
+        
+        profiler = cProfile.Profile()
+        try:
+            await ProfiledSteps(self.app(scope, receive, send_wrapper), profiler)
+        finally:
+            _timings.reset(token)
+        
+        total = time.perf_counter() - started
+        if total * 1000 >= settings.profiling_slow_threshold_ms:
+            await asyncio.to_thread(self._dump, profiler, scope, total)
+    
+    def _enabled(self, scope) -> bool:
+        if settings.profiling_mode == "always":
+            return True
+        if settings.profiling_mode == "header":
+            header = settings.profiling_header.lower().encode("latin-1")
+            return any(name == header for name, _ in scope.get("headers", []))
+        return False
+    
+    def _dump(self, profiler: cProfile.Profile, scope, total: float):
+        directory = Path(settings.profiling_dump_dir)
+        directory.mkdir(parents=True, exist_ok=True)
+        path = profile_path(directory, scope["method"], scope["path"], total)
+        profiler.dump_stats(str(path))
+        logger.warning(f"Slow request {scope['method']} {scope['path']} took {total * 1000:.0f}ms, profile written to {path}")
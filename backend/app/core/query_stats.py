@@ -0,0 +1,106 @@
+import logging
+import re
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy import event
+
+from app.core.config import settings
+from app.core.metrics import DB_STATEMENT_DURATION, DB_STATEMENTS_PER_REQUEST
+from app.core.profiling import record_timing
+
+logger = logging.getLogger(__name__)
+
+MAX_LOGGED_STATEMENT_LENGTH = 1000
+
+_query_stats: ContextVar[Optional["QueryStats"]] = ContextVar("query_stats", default=None)
+
+
+@dataclass
+class QueryStats:
+    scope: str
+    count: int = 0
+    duration: float = 0.0
+
+
+@contextmanager
+def track_queries(scope: str):
+    stats = QueryStats(scope)
+    token = _query_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _query_stats.reset(token)
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    return _query_stats.get()
+
+
+def redact_parameters(parameters, executemany: bool) -> str:
+    if not parameters:
+        return "no parameters"
+    if executemany:
+        return f"{len(parameters)} parameter sets of {len(parameters[0])} values redacted"
+    return f"{len(parameters)} parameters redacted"
+
+
+def record_query(statement: str, parameters, executemany: bool, elapsed: float):
+    record_timing("db", elapsed)
+    stats = _query_stats.get()
+    if stats is not None:
+        stats.count += 1
+        stats.duration += elapsed
+    DB_STATEMENT_DURATION.labels(scope=stats.scope if stats is not None else "other").observe(elapsed)
+    
+    if settings.slow_query_threshold_ms > 0 and elapsed * 1000 >= settings.slow_query_threshold_ms:
+        text = re.sub(r"\s+", " ", statement).strip()
+        if len(text) > MAX_LOGGED_STATEMENT_LENGTH:
+            text = f"{text[:MAX_LOGGED_STATEMENT_LENGTH]}..."
+        logger.warning(
+            f"Slow query ({elapsed * 1000:.1f}ms, {redact_parameters(parameters, executemany)}): {text}"
+        )
+
+
+def instrument_engine(engine):
+    sync_engine = getattr(engine, "sync_engine", engine)
+    
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+    
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        record_query(statement, parameters, executemany, time.perf_counter() - conn.info["query_started"].pop())
+    
+    @event.listens_for(sync_engine, "handle_error")
+    def handle_error(context):
+        started = context.connection.info.get("query_started") if context.connection is not None else None
+        if started:
+            started.pop()
+    
+    return engine
+
+
+class QueryStatsMiddleware:
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        with track_queries("request") as stats:
+            async def send_wrapper(message):
+                if message["type"] == "http.response.start":
+                    message["headers"] = [*message.get("headers", []), (b"x-query-count", str(stats.count).encode())]
+                await send(message)
+            
+            await self.app(scope, receive, send_wrapper)
+        
+        route = scope.get("route")
+        DB_STATEMENTS_PER_REQUEST.labels(route=route.path if route is not None else "unmatched").observe(stats.count)
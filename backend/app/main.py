@@ -1,10 +1,17 @@
 import logging
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.routes import news
-from app.core.database import engine, Base
+from app.core.config import settings
+from app.core.database import async_engine
+from app.core.http import close_http_client, start_http_client
+from app.core.metrics import MetricsMiddleware, render_metrics
+from app.core.profiling import ProfilingMiddleware
+from app.core.query_stats import QueryStatsMiddleware
+from app.core.migrations import run_migrations
+from app.services.jobs import fetch_jobs
 from app.services.scheduler import start_scheduler, shutdown_scheduler
 
 logging.basicConfig(
@@ -18,11 +25,15 @@ logger = logging.getLogger(__name__)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("Starting up application")
-    Base.metadata.create_all(bind=engine)
+    run_migrations()
+    await start_http_client()
     start_scheduler()
     yield
     logger.info("Shutting down application")
     shutdown_scheduler()
+    await fetch_jobs.shutdown()
+    await close_http_client()
+    await async_engine.dispose()
 
 
 app = FastAPI(
@@ -38,8 +49,15 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag", "Server-Timing", "X-Query-Count"],
 )
 
+app.add_middleware(QueryStatsMiddleware)
+app.add_middleware(ProfilingMiddleware)
+
+if settings.metrics_enabled:
+    app.add_middleware(MetricsMiddleware)
+
 app.include_router(news.router, prefix="/api", tags=["news"])
 
 
@@ -47,3 +65,10 @@ app.include_router(news.router, prefix="/api", tags=["news"])
 def root():
     return {"message": "AI News API", "status": "running"}
 
+
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    if not settings.metrics_enabled:
+        return Response(status_code=404)
+    content, media_type = render_metrics()
+    return Response(content=content, media_type=media_type)
@@ -1,9 +1,13 @@
 from datetime import datetime, UTC
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean
+from sqlalchemy import BigInteger, Column, Date, Integer, String, Text, DateTime, Boolean, ForeignKey, Index
 
 from app.core.database import Base
 
 
+def utcnow() -> datetime:
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
 class News(Base):
     __tablename__ = "news"
     
@@ -14,7 +18,7 @@ class News(Base):
     source = Column(String, nullable=False)
     url = Column(String, nullable=False, unique=True)
     published_at = Column(DateTime, nullable=False)
-    created_at = Column(DateTime, default=lambda: datetime.now(UTC), nullable=False)
+    created_at = Column(DateTime, default=utcnow, nullable=False)
     hn_id = Column(Integer, nullable=True)
     score = Column(Integer, nullable=True)
     comments_count = Column(Integer, nullable=True)
@@ -22,4 +26,35 @@ class News(Base):
     image_url = Column(String, nullable=True)
     search_position = Column(Integer, nullable=True)
     from_serper = Column(Boolean, default=False, nullable=True)
+    canonical_url = Column(String, nullable=True, index=True)
+    simhash = Column(BigInteger, nullable=True)
+    simhash_band_0 = Column(Integer, nullable=True, index=True)
+    simhash_band_1 = Column(Integer, nullable=True, index=True)
+    simhash_band_2 = Column(Integer, nullable=True, index=True)
+    simhash_band_3 = Column(Integer, nullable=True, index=True)
+    
+    __table_args__ = (
+        Index("ix_news_created_at_id", created_at.desc(), id.desc()),
+        Index("ix_news_source_created_at_id", source, created_at.desc(), id.desc()),
+    )
 
+
+class NewsDuplicate(Base):
+    __tablename__ = "news_duplicates"
+    
+    id = Column(Integer, primary_key=True)
+    news_id = Column(Integer, ForeignKey("news.id", ondelete="CASCADE"), nullable=False, index=True)
+    url = Column(String, nullable=False, unique=True)
+    title = Column(String, nullable=False)
+    source = Column(String, nullable=False)
+    distance = Column(Integer, nullable=False)
+    created_at = Column(DateTime, default=utcnow, nullable=False)
+
+
+class NewsTermStat(Base):
+    __tablename__ = "news_term_stats"
+    
+    day = Column(Date, primary_key=True)
+    source = Column(String, primary_key=True)
+    term = Column(String, primary_key=True)
+    count = Column(Integer, nullable=False)
@@ -0,0 +1,18 @@
+from datetime import datetime
+from typing import Dict, Optional
+from pydantic import BaseModel
+
+
+class FetchJob(BaseModel):
+    job_id: str
+    trigger: str
+    status: str = "queued"
+    stage: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    saved: Optional[int] = None
+    duplicates: Optional[int] = None
+    error: Optional[str] = None
+    timings: Dict[str, float] = {}
+    queries: Dict[str, int] = {}
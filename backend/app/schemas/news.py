@@ -1,6 +1,12 @@
-from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel
+from datetime import UTC, datetime
+from typing import Dict, List, Optional
+from pydantic import BaseModel, field_validator
+
+
+def to_naive_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(UTC).replace(tzinfo=None)
 
 
 class NewsBase(BaseModel):
@@ -20,7 +26,10 @@ class NewsBase(BaseModel):
 
 
 class NewsCreate(NewsBase):
-    pass
+    @field_validator("published_at")
+    @classmethod
+    def published_at_naive_utc(cls, value: datetime) -> datetime:
+        return to_naive_utc(value)
 
 
 class NewsResponse(NewsBase):
@@ -29,3 +38,27 @@ class NewsResponse(NewsBase):
     
     model_config = {"from_attributes": True}
 
+
+
+class NewsCompactResponse(BaseModel):
+    id: int
+    title: str
+    summary: str
+    source: str
+    url: str
+    published_at: datetime
+    created_at: datetime
+    priority: Optional[int] = None
+    image_url: Optional[str] = None
+    
+    model_config = {"from_attributes": True}
+
+
+class NewsSearchResult(NewsCompactResponse):
+    rank: float
+    highlight: Optional[str] = None
+
+
+class NewsTags(BaseModel):
+    tags: List[str]
+    counts: Dict[str, int]
@@ -0,0 +1,105 @@
+import hashlib
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+SIMHASH_BITS = 64
+SIMHASH_BANDS = 4
+BAND_BITS = SIMHASH_BITS // SIMHASH_BANDS
+MIN_SIMHASH_TOKENS = 8
+
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "msclkid", "mc_cid", "mc_eid", "igshid", "yclid",
+    "ref", "ref_src", "ref_url", "referrer", "source", "cmpid", "ocid", "smid", "guccounter",
+}
+TRACKING_PREFIXES = ("utm_", "at_", "pk_", "_hs")
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def canonicalize_url(url: str) -> str:
+    parts = urlsplit(url.strip())
+    host = (parts.hostname or "").lower().removeprefix("www.").removeprefix("m.")
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+    
+    path = re.sub(r"/{2,}", "/", parts.path).rstrip("/") or "/"
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    )
+    return urlunsplit(("https", host, path, urlencode(query), ""))
+
+
+def simhash(text: str) -> Optional[int]:
+    tokens = TOKEN_PATTERN.findall(text.lower())
+    if len(tokens) < MIN_SIMHASH_TOKENS:
+        return None
+    
+    weights = [0] * SIMHASH_BITS
+    for feature in tokens:
+        value = int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=8).digest(), "big")
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += 1 if value >> bit & 1 else -1
+    
+    fingerprint = sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+    return fingerprint - (1 << SIMHASH_BITS) if fingerprint >= 1 << (SIMHASH_BITS - 1) else fingerprint
+
+
+def simhash_bands(fingerprint: int) -> List[int]:
+    unsigned = fingerprint % (1 << SIMHASH_BITS)
+    mask = (1 << BAND_BITS) - 1
+    return [unsigned >> (band * BAND_BITS) & mask for band in range(SIMHASH_BANDS)]
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return ((a ^ b) % (1 << SIMHASH_BITS)).bit_count()
+
+
+@dataclass
+class Signature:
+    canonical_url: str
+    simhash: Optional[int]
+    
+    @property
+    def bands(self) -> List[int]:
+        return simhash_bands(self.simhash) if self.simhash is not None else []
+    
+    def columns(self) -> dict:
+        columns = {"canonical_url": self.canonical_url, "simhash": self.simhash}
+        bands = self.bands or [None] * SIMHASH_BANDS
+        for band, value in enumerate(bands):
+            columns[f"simhash_band_{band}"] = value
+        return columns
+
+
+def signature_for(url: str, title: str, body: str) -> Signature:
+    return Signature(canonicalize_url(url), simhash(f"{title} {body}"))
+
+
+class NearDuplicateIndex:
+    def __init__(self, max_distance: int):
+        self.max_distance = max_distance
+        self.by_url: Dict[str, object] = {}
+        self.by_band: Dict[Tuple[int, int], List[Tuple[int, object]]] = {}
+    
+    def add(self, key, signature: Signature):
+        self.by_url.setdefault(signature.canonical_url, key)
+        if signature.simhash is not None:
+            for band, value in enumerate(signature.bands):
+                self.by_band.setdefault((band, value), []).append((signature.simhash, key))
+    
+    def match(self, signature: Signature) -> Optional[Tuple[object, int]]:
+        if signature.canonical_url in self.by_url:
+            return self.by_url[signature.canonical_url], 0
+        if signature.simhash is None:
+            return None
+        
+        best = None
+        for band, value in enumerate(signature.bands):
+            for fingerprint, key in self.by_band.get((band, value), ()):
+                distance = hamming_distance(signature.simhash, fingerprint)
+                if distance <= self.max_distance and (best is None or distance < best[1]):
+                    best = (key, distance)
+        return best
@@ -0,0 +1,151 @@
+import asyncio
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import datetime, UTC
+from typing import List, Optional, Tuple
+
+from app.core.database import AsyncSessionLocal
+from app.core.metrics import FETCH_LAST_SUCCESS
+from app.core.query_stats import track_queries
+from app.schemas.jobs import FetchJob
+from app.services.news_fetcher import fetch_and_save_news
+from app.services.scheduler import export_news_snapshot
+
+logger = logging.getLogger(__name__)
+
+
+class FetchJobManager:
+    def __init__(self, max_history: int = 50):
+        self.max_history = max_history
+        self._jobs: OrderedDict[str, FetchJob] = OrderedDict()
+        self._tasks: dict[str, asyncio.Task] = {}
+        self._scopes: dict[str, Tuple[Optional[List[str]], Optional[List[str]]]] = {}
+        self._current: Optional[FetchJob] = None
+        self._next: Optional[FetchJob] = None
+    
+    def submit(
+        self,
+        trigger: str,
+        queries: Optional[List[str]] = None,
+        providers: Optional[List[str]] = None
+    ) -> Tuple[FetchJob, bool]:
+        if self._current is not None:
+            for job in (self._current, self._next):
+                if job is not None and self._covers(job, queries, providers):
+                    logger.info(f"Fetch job {job.job_id} already covers {trigger} trigger, merging")
+                    return job, False
+            
+            if self._next is not None:
+                logger.info(f"Widening queued fetch job {self._next.job_id} to a full fetch for {trigger} trigger")
+                self._scopes[self._next.job_id] = (None, None)
+                return self._next, False
+            
+            job = self._create(trigger, queries, providers)
+            self._next = job
+            previous = self._tasks[self._current.job_id]
+            self._tasks[job.job_id] = asyncio.create_task(self._run_after(previous, job))
+            logger.info(f"Queued fetch job {job.job_id} ({trigger}) behind {self._current.job_id}")
+            return job, True
+        
+        job = self._create(trigger, queries, providers)
+        self._current = job
+        self._tasks[job.job_id] = asyncio.create_task(self._run(job))
+        logger.info(f"Queued fetch job {job.job_id} ({trigger})")
+        return job, True
+    
+    def get(self, job_id: str) -> Optional[FetchJob]:
+        return self._jobs.get(job_id)
+    
+    async def wait(self, job: FetchJob) -> FetchJob:
+        task = self._tasks.get(job.job_id)
+        if task is not None:
+            await asyncio.shield(task)
+        return job
+    
+    async def shutdown(self):
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    
+    def _create(self, trigger: str, queries: Optional[List[str]], providers: Optional[List[str]]) -> FetchJob:
+        job = FetchJob(job_id=uuid.uuid4().hex, trigger=trigger, created_at=datetime.now(UTC))
+        self._jobs[job.job_id] = job
+        self._scopes[job.job_id] = (queries, providers)
+        self._trim_history()
+        return job
+    
+    def _covers(self, job: FetchJob, queries: Optional[List[str]], providers: Optional[List[str]]) -> bool:
+        scope = self._scopes[job.job_id]
+        return scope == (None, None) or scope == (queries, providers)
+    
+    async def _run_after(self, previous: asyncio.Task, job: FetchJob):
+        try:
+            await asyncio.wait([previous])
+        except asyncio.CancelledError:
+            job.status = "cancelled"
+            raise
+        await self._run(job)
+    
+    async def _run(self, job: FetchJob):
+        queries, providers = self._scopes[job.job_id]
+        job.status = "running"
+        job.started_at = datetime.now(UTC)
+        started = time.perf_counter()
+        
+        try:
+            with self._stage(job, "ingest"):
+                async with AsyncSessionLocal() as db:
+                    job.saved, job.duplicates = await fetch_and_save_news(
+                        db,
+                        queries,
+                        use_cache=job.trigger == "manual",
+                        providers=providers
+                    )
+            
+            with self._stage(job, "export"):
+                await asyncio.to_thread(export_news_snapshot)
+            
+            job.status = "succeeded"
+            FETCH_LAST_SUCCESS.labels(trigger=job.trigger).set_to_current_time()
+            logger.info(f"Fetch job {job.job_id} finished: {job.saved} new, {job.duplicates} duplicates")
+        except asyncio.CancelledError:
+            job.status = "cancelled"
+            raise
+        except Exception as e:
+            job.status = "failed"
+            job.error = str(e)
+            logger.error(f"Fetch job {job.job_id} failed: {e}")
+        finally:
+            job.stage = None
+            job.finished_at = datetime.now(UTC)
+            job.timings["total"] = round(time.perf_counter() - started, 3)
+            self._tasks.pop(job.job_id, None)
+            self._scopes.pop(job.job_id, None)
+            if self._current is job:
+                self._current, self._next = self._next, None
+    
+    @contextmanager
+    def _stage(self, job: FetchJob, name: str):
+        job.stage = name
+        started = time.perf_counter()
+        with track_queries(name) as stats:
+            try:
+                yield
+            finally:
+                job.timings[name] = round(time.perf_counter() - started, 3)
+                job.queries[name] = stats.count
+                logger.info(f"Fetch job {job.job_id} {name} ran {stats.count} SQL statements in {stats.duration:.3f}s")
+    
+    def _trim_history(self):
+        for job_id in list(self._jobs):
+            if len(self._jobs) <= self.max_history:
+                break
+            if job_id not in self._tasks:
+                del self._jobs[job_id]
+
+
+fetch_jobs = FetchJobManager()
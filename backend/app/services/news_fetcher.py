@@ -1,41 +1,101 @@
+import asyncio
 import logging
-from datetime import datetime
-from typing import List
+import time
+from datetime import UTC, datetime
+from typing import Dict, List, Optional, Tuple
 import httpx
+from sqlalchemy import insert as insert_statement, or_, select
+from sqlalchemy.dialects import postgresql, sqlite
 
+from app.core.cache import news_cache
 from app.core.config import settings
+from app.core.http import get_http_client, http_client_session
+from app.core.metrics import INGEST_STAGE_DURATION, NEWS_ITEMS, SERPER_REQUEST_DURATION, observe_duration
 from app.schemas.news import NewsCreate
+from app.services.dedup import SIMHASH_BANDS, NearDuplicateIndex, Signature, signature_for
+from app.services.resilience import (
+    RETRYABLE_STATUS_CODES,
+    CircuitBreaker,
+    TokenBucket,
+    backoff_delay,
+    parse_retry_after,
+    serper_circuit_breaker,
+    serper_rate_limiter,
+)
+from app.services.search_cache import get_search_cache
+from app.services.tags import record_term_stats
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_SEARCH_QUERIES = [
+    "AI artificial intelligence",
+    "machine learning",
+    "LLM large language model",
+    "deep learning",
+    "neural networks"
+]
+
 
 class NewsFetcher:
-    def __init__(self, api_key: str):
+    def __init__(
+        self,
+        api_key: str,
+        client: Optional[httpx.AsyncClient] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        use_cache: bool = True
+    ):
         self.api_key = api_key
-        self.base_url = "https://google.serper.dev/search"
+        self.client = client
+        self.rate_limiter = rate_limiter or serper_rate_limiter
+        self.circuit_breaker = circuit_breaker or serper_circuit_breaker
+        self.search_cache = get_search_cache() if use_cache else None
+        self.base_url = settings.serper_base_url
         self.max_searches = settings.max_serper_searches
+        self.concurrency = max(1, settings.serper_concurrency)
+        self.timeout = settings.serper_timeout_seconds
+        self.deadline = settings.serper_fetch_deadline_seconds
+        self.max_retries = max(0, settings.serper_max_retries)
+        self.retry_base_delay = settings.serper_retry_base_delay_seconds
+        self.retry_max_delay = settings.serper_retry_max_delay_seconds
         
-    async def fetch_news(self) -> List[NewsCreate]:
-        search_queries = [
-            "AI artificial intelligence",
-            "machine learning",
-            "LLM large language model",
-            "deep learning",
-            "neural networks"
-        ][:self.max_searches]
+    async def fetch_news(self, queries: Optional[List[str]] = None) -> List[NewsCreate]:
+        search_queries = list(queries if queries is not None else DEFAULT_SEARCH_QUERIES)[:self.max_searches]
         
-        all_news = []
-        logger.info(f"Starting news fetch with {len(search_queries)} searches")
+        logger.info(
+            f"Starting news fetch with {len(search_queries)} searches "
+            f"(concurrency {self.concurrency}, deadline {self.deadline}s)"
+        )
         
-        async with httpx.AsyncClient() as client:
-            for idx, query in enumerate(search_queries, 1):
-                try:
+        semaphore = asyncio.Semaphore(self.concurrency)
+        
+        async with http_client_session(self.client) as client:
+            async def run_query(idx: int, query: str) -> List[NewsCreate]:
+                async with semaphore:
                     logger.info(f"Search {idx}/{len(search_queries)}: {query}")
                     news_items = await self._search_query(client, query, idx)
-                    all_news.extend(news_items)
                     logger.info(f"Found {len(news_items)} items for query: {query}")
-                except Exception as e:
-                    logger.error(f"Error fetching news for query '{query}': {e}")
+                    return news_items
+            
+            tasks = [
+                asyncio.create_task(run_query(idx, query))
+                for idx, query in enumerate(search_queries, 1)
+            ]
+            done, pending = await asyncio.wait(tasks, timeout=self.deadline)
+            
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        
+        all_news = []
+        for query, task in zip(search_queries, tasks):
+            if task in pending:
+                logger.error(f"Search for query '{query}' did not finish within {self.deadline}s deadline")
+            elif task.exception() is not None:
+                logger.error(f"Error fetching news for query '{query}': {task.exception()}")
+            else:
+                all_news.extend(task.result())
         
         logger.info(f"Total news items fetched: {len(all_news)}")
         return all_news
@@ -51,21 +111,65 @@ class NewsFetcher:
             "num": 10
         }
         
-        try:
-            response = await client.post(
-                self.base_url,
-                json=payload,
-                headers=headers,
-                timeout=30.0
-            )
-            response.raise_for_status()
-            data = response.json()
+        if self.search_cache is not None:
+            cached = await asyncio.to_thread(self.search_cache.get, query, payload["num"])
+            if cached is not None:
+                return self._parse_serper_response(cached, position)
+        
+        for attempt in range(self.max_retries + 1):
+            self.circuit_breaker.before_call()
+            try:
+                await self.rate_limiter.acquire()
+                retry_after = None
+                started = time.perf_counter()
+                
+                try:
+                    response = await client.post(
+                        self.base_url,
+                        json=payload,
+                        headers=headers,
+                        timeout=self.timeout
+                    )
+                except httpx.TransportError as e:
+                    SERPER_REQUEST_DURATION.labels(query=query, status="error").observe(time.perf_counter() - started)
+                    error = e
+                else:
+                    SERPER_REQUEST_DURATION.labels(query=query, status=str(response.status_code)).observe(
+                        time.perf_counter() - started
+                    )
+                    if response.status_code not in RETRYABLE_STATUS_CODES:
+                        self.circuit_breaker.record_success()
+                        try:
+                            response.raise_for_status()
+                        except httpx.HTTPError as e:
+                            logger.error(f"HTTP error occurred: {e}")
+                            raise
+                        data = response.json()
+                        if self.search_cache is not None:
+                            await asyncio.to_thread(self.search_cache.set, query, payload["num"], data)
+                        return self._parse_serper_response(data, position)
+                    
+                    error = httpx.HTTPStatusError(
+                        f"Server returned {response.status_code} for query '{query}'",
+                        request=response.request,
+                        response=response
+                    )
+                    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            except BaseException:
+                self.circuit_breaker.release_trial()
+                raise
             
-            return self._parse_serper_response(data, position)
+            self.circuit_breaker.record_failure()
+            if attempt == self.max_retries:
+                logger.error(f"HTTP error occurred: {error}")
+                raise error
             
-        except httpx.HTTPError as e:
-            logger.error(f"HTTP error occurred: {e}")
-            raise
+            delay = backoff_delay(attempt, self.retry_base_delay, self.retry_max_delay, retry_after)
+            logger.warning(
+                f"Attempt {attempt + 1}/{self.max_retries + 1} for query '{query}' failed ({error}), "
+                f"retrying in {delay:.2f}s"
+            )
+            await asyncio.sleep(delay)
     
     def _parse_serper_response(self, data: dict, search_position: int) -> List[NewsCreate]:
         news_items = []
@@ -107,28 +211,153 @@ class NewsFetcher:
             return datetime.now(UTC)
 
 
-async def fetch_and_save_news(db_session):
-    from app.models.news import News
+async def fetch_and_save_news(
+    db_session,
+    queries: Optional[List[str]] = None,
+    use_cache: bool = True,
+    providers: Optional[List[str]] = None
+):
+    from app.services.providers.collector import build_providers, collect_news
+    
+    with observe_duration(INGEST_STAGE_DURATION, stage="collect"):
+        collected = await collect_news(build_providers(queries, use_cache, providers), get_http_client())
+    news_items = [item for items in collected.values() for item in items]
     
-    fetcher = NewsFetcher(settings.serper_api_key)
-    news_items = await fetcher.fetch_news()
+    with observe_duration(INGEST_STAGE_DURATION, stage="save"):
+        saved_count, duplicate_count = await save_news_items(db_session, news_items)
+    NEWS_ITEMS.labels(outcome="collected").inc(len(news_items))
+    NEWS_ITEMS.labels(outcome="saved").inc(saved_count)
+    NEWS_ITEMS.labels(outcome="duplicate").inc(duplicate_count)
+    logger.info(f"Saved {saved_count} new items, skipped {duplicate_count} duplicates")
     
-    saved_count = 0
-    duplicate_count = 0
+    if saved_count:
+        news_cache.clear()
     
+    return saved_count, duplicate_count
+
+
+async def save_news_items(db_session, news_items: List[NewsCreate]) -> Tuple[int, int]:
+    batch_index = NearDuplicateIndex(settings.dedup_max_simhash_distance)
+    unique = []
+    clones = []
     for news_data in news_items:
-        existing = db_session.query(News).filter(News.url == news_data.url).first()
+        signature = signature_for(news_data.url, news_data.title, news_data.body)
+        match = batch_index.match(signature)
+        if match is None:
+            batch_index.add(len(unique), signature)
+            unique.append((news_data, signature))
+        else:
+            clones.append((news_data, unique[match[0]][0].url, match[1]))
+    
+    chunk_size = max(1, settings.ingest_chunk_size)
+    inserted_ids = {}
+    cluster_ids = {}
+    today = datetime.now(UTC).date()
+    
+    for start in range(0, len(unique), chunk_size):
+        chunk = unique[start:start + chunk_size]
+        matches = await _find_near_duplicates(db_session, [signature for _, signature in chunk])
         
-        if existing:
-            duplicate_count += 1
-            continue
+        rows = []
+        for (news_data, signature), match in zip(chunk, matches):
+            if match is None:
+                rows.append({**news_data.model_dump(), **signature.columns()})
+            else:
+                (news_id, original_url), distance = match
+                cluster_ids[original_url] = cluster_ids[news_data.url] = news_id
+                clones.append((news_data, original_url, distance))
         
-        news = News(**news_data.model_dump())
-        db_session.add(news)
-        saved_count += 1
+        if rows:
+            inserted = await _insert_new_rows(db_session, rows)
+            inserted_ids.update(inserted)
+            cluster_ids.update(inserted)
+            await record_term_stats(db_session, [
+                (today, row["source"], row["title"], row["body"]) for row in rows if row["url"] in inserted
+            ])
     
-    db_session.commit()
-    logger.info(f"Saved {saved_count} new items, skipped {duplicate_count} duplicates")
+    duplicate_rows = [
+        {
+            "news_id": cluster_ids[original_url],
+            "url": news_data.url,
+            "title": news_data.title,
+            "source": news_data.source,
+            "distance": distance,
+        }
+        for news_data, original_url, distance in clones
+        if original_url in cluster_ids and news_data.url != original_url
+    ]
     
-    return saved_count, duplicate_count
+    for start in range(0, len(duplicate_rows), chunk_size):
+        await _insert_duplicate_rows(db_session, duplicate_rows[start:start + chunk_size])
+    
+    await db_session.commit()
+    
+    saved_count = len(inserted_ids)
+    return saved_count, len(news_items) - saved_count
+
+
+async def _find_near_duplicates(db_session, signatures: List[Signature]) -> List[Optional[tuple]]:
+    from app.models.news import News
+    
+    band_columns = [getattr(News, f"simhash_band_{band}") for band in range(SIMHASH_BANDS)]
+    conditions = [News.canonical_url.in_({signature.canonical_url for signature in signatures})]
+    for band, column in enumerate(band_columns):
+        values = {signature.bands[band] for signature in signatures if signature.simhash is not None}
+        if values:
+            conditions.append(column.in_(values))
+    
+    candidates = await db_session.execute(
+        select(News.id, News.url, News.canonical_url, News.simhash).where(or_(*conditions))
+    )
+    
+    index = NearDuplicateIndex(settings.dedup_max_simhash_distance)
+    for row in candidates:
+        index.add((row.id, row.url), Signature(row.canonical_url, row.simhash))
+    return [index.match(signature) for signature in signatures]
 
+
+def _insert_statement(db_session, model):
+    dialect = db_session.get_bind().dialect.name
+    if dialect == "postgresql":
+        return postgresql.insert(model)
+    if dialect == "sqlite":
+        return sqlite.insert(model)
+    return None
+
+
+async def _insert_new_rows(db_session, rows: List[dict]) -> Dict[str, int]:
+    from app.models.news import News
+    
+    insert = _insert_statement(db_session, News)
+    if insert is not None:
+        statement = (
+            insert
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=[News.url])
+            .returning(News.url, News.id)
+        )
+        return dict((await db_session.execute(statement)).tuples().all())
+    
+    urls = [row["url"] for row in rows]
+    existing = set(await db_session.scalars(select(News.url).where(News.url.in_(urls))))
+    new_rows = [row for row in rows if row["url"] not in existing]
+    if not new_rows:
+        return {}
+    await db_session.execute(insert_statement(News), new_rows)
+    new_urls = [row["url"] for row in new_rows]
+    return dict((await db_session.execute(select(News.url, News.id).where(News.url.in_(new_urls)))).tuples().all())
+
+
+async def _insert_duplicate_rows(db_session, rows: List[dict]):
+    from app.models.news import NewsDuplicate
+    
+    insert = _insert_statement(db_session, NewsDuplicate)
+    if insert is not None:
+        await db_session.execute(insert.values(rows).on_conflict_do_nothing(index_elements=[NewsDuplicate.url]))
+        return
+    
+    urls = [row["url"] for row in rows]
+    existing = set(await db_session.scalars(select(NewsDuplicate.url).where(NewsDuplicate.url.in_(urls))))
+    new_rows = [row for row in rows if row["url"] not in existing]
+    if new_rows:
+        await db_session.execute(insert_statement(NewsDuplicate), new_rows)
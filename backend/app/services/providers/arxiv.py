@@ -0,0 +1,40 @@
+import logging
+from typing import List
+
+import httpx
+
+from app.core.config import settings
+from app.schemas.news import NewsCreate
+from app.services.providers.rss import RSSProvider
+
+logger = logging.getLogger(__name__)
+
+
+class ArxivProvider(RSSProvider):
+    name = "arxiv"
+    priority = 3
+    
+    def __init__(self, base_url: str = "https://export.arxiv.org/api/query"):
+        super().__init__(feed_urls=[])
+        self.concurrency = 1
+        self.timeout = settings.arxiv_timeout_seconds
+        self.base_url = base_url
+        self.categories = settings.arxiv_categories
+        self.max_results = settings.arxiv_max_results
+    
+    async def fetch(self, client: httpx.AsyncClient) -> List[NewsCreate]:
+        params = {
+            "search_query": " OR ".join(f"cat:{category}" for category in self.categories),
+            "sortBy": "submittedDate",
+            "sortOrder": "descending",
+            "max_results": self.max_results,
+        }
+        response = await client.get(self.base_url, params=params, timeout=self.timeout, follow_redirects=True)
+        response.raise_for_status()
+        
+        news_items = self.parse_feed(response.content, self.base_url)
+        logger.info(f"arXiv: {len(news_items)} papers for {', '.join(self.categories)}")
+        return news_items
+    
+    def _source_name(self, title: str | None, feed_url: str) -> str:
+        return "arxiv"
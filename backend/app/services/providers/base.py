@@ -0,0 +1,43 @@
+import asyncio
+import html
+import logging
+import re
+from abc import ABC, abstractmethod
+from typing import List
+
+import httpx
+
+from app.schemas.news import NewsCreate
+
+logger = logging.getLogger(__name__)
+
+TAG_PATTERN = re.compile(r"<[^>]+>")
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+class SourceProvider(ABC):
+    name = "base"
+    
+    def __init__(self, concurrency: int = 5, timeout: float = 30.0):
+        self.concurrency = max(1, concurrency)
+        self.timeout = timeout
+    
+    @abstractmethod
+    async def fetch(self, client: httpx.AsyncClient) -> List[NewsCreate]:
+        ...
+    
+    async def gather_limited(self, coroutines) -> list:
+        semaphore = asyncio.Semaphore(self.concurrency)
+        
+        async def run(coroutine):
+            async with semaphore:
+                return await coroutine
+        
+        return await asyncio.gather(*(run(coroutine) for coroutine in coroutines), return_exceptions=True)
+
+
+def clean_text(text: str | None) -> str:
+    if not text:
+        return ""
+    text = html.unescape(TAG_PATTERN.sub(" ", text))
+    return WHITESPACE_PATTERN.sub(" ", text).strip()
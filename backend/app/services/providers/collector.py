@@ -0,0 +1,60 @@
+import asyncio
+import logging
+from typing import Dict, List, Optional
+
+import httpx
+
+from app.core.config import settings
+from app.core.http import http_client_session
+from app.schemas.news import NewsCreate
+from app.services.providers.arxiv import ArxivProvider
+from app.services.providers.base import SourceProvider
+from app.services.providers.hackernews import HackerNewsProvider
+from app.services.providers.rss import RSSProvider
+from app.services.providers.serper import SerperProvider
+
+logger = logging.getLogger(__name__)
+
+
+def build_providers(
+    queries: Optional[List[str]] = None,
+    use_cache: bool = True,
+    names: Optional[List[str]] = None
+) -> List[SourceProvider]:
+    factories = {
+        "serper": lambda: SerperProvider(queries, use_cache=use_cache),
+        "hackernews": HackerNewsProvider,
+        "rss": RSSProvider,
+        "arxiv": ArxivProvider,
+    }
+    
+    providers = []
+    for name in names if names is not None else settings.news_providers:
+        if name not in factories:
+            logger.warning(f"Unknown news provider '{name}', skipping")
+            continue
+        providers.append(factories[name]())
+    return providers
+
+
+async def collect_news(
+    providers: List[SourceProvider],
+    client: Optional[httpx.AsyncClient] = None
+) -> Dict[str, List[NewsCreate]]:
+    async with http_client_session(client) as session:
+        async def run(provider: SourceProvider) -> List[NewsCreate]:
+            try:
+                return await asyncio.wait_for(provider.fetch(session), timeout=provider.timeout)
+            except asyncio.TimeoutError:
+                logger.error(f"Provider '{provider.name}' did not finish within {provider.timeout}s")
+            except Exception as e:
+                logger.error(f"Provider '{provider.name}' failed: {e}")
+            return []
+        
+        results = await asyncio.gather(*(run(provider) for provider in providers))
+    
+    collected = {provider.name: items for provider, items in zip(providers, results)}
+    logger.info(
+        "Collected " + ", ".join(f"{len(items)} from {name}" for name, items in collected.items())
+    )
+    return collected
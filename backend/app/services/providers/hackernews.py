@@ -0,0 +1,65 @@
+import logging
+from datetime import UTC, datetime
+from typing import List, Optional
+
+import httpx
+
+from app.core.config import settings
+from app.schemas.news import NewsCreate
+from app.services.providers.base import SourceProvider, clean_text
+
+logger = logging.getLogger(__name__)
+
+
+class HackerNewsProvider(SourceProvider):
+    name = "hackernews"
+    
+    def __init__(self, base_url: str = "https://hacker-news.firebaseio.com/v0"):
+        super().__init__(settings.hackernews_concurrency, settings.hackernews_timeout_seconds)
+        self.base_url = base_url.rstrip("/")
+        self.max_stories = settings.hackernews_max_stories
+        self.keywords = [keyword.lower() for keyword in settings.hackernews_keywords]
+    
+    async def fetch(self, client: httpx.AsyncClient) -> List[NewsCreate]:
+        response = await client.get(f"{self.base_url}/topstories.json", timeout=self.timeout)
+        response.raise_for_status()
+        story_ids = response.json()[:self.max_stories]
+        
+        results = await self.gather_limited(self._fetch_item(client, story_id) for story_id in story_ids)
+        
+        news_items = []
+        for story_id, result in zip(story_ids, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to fetch Hacker News item {story_id}: {result}")
+            elif result is not None:
+                news_items.append(result)
+        
+        logger.info(f"Hacker News: {len(news_items)} matching stories out of {len(story_ids)}")
+        return news_items
+    
+    async def _fetch_item(self, client: httpx.AsyncClient, story_id: int) -> Optional[NewsCreate]:
+        response = await client.get(f"{self.base_url}/item/{story_id}.json", timeout=self.timeout)
+        response.raise_for_status()
+        return self.parse_item(response.json())
+    
+    def parse_item(self, item: dict | None) -> Optional[NewsCreate]:
+        if not item or item.get("type") != "story" or item.get("dead") or item.get("deleted"):
+            return None
+        
+        title = item.get("title", "")
+        if self.keywords and not any(keyword in title.lower() for keyword in self.keywords):
+            return None
+        
+        body = clean_text(item.get("text")) or title
+        return NewsCreate(
+            title=title,
+            body=body,
+            summary=body[:200],
+            source="hackernews",
+            url=item.get("url") or f"https://news.ycombinator.com/item?id={item['id']}",
+            published_at=datetime.fromtimestamp(item.get("time", 0), UTC) if item.get("time") else datetime.now(UTC),
+            hn_id=item["id"],
+            score=item.get("score"),
+            comments_count=item.get("descendants"),
+            priority=1,
+        )
@@ -0,0 +1,119 @@
+import logging
+import xml.etree.ElementTree as ET
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import List, Optional
+from urllib.parse import urlparse
+
+import httpx
+
+from app.core.config import settings
+from app.schemas.news import NewsCreate
+from app.services.providers.base import SourceProvider, clean_text
+
+logger = logging.getLogger(__name__)
+
+ATOM = "{http://www.w3.org/2005/Atom}"
+
+
+class RSSProvider(SourceProvider):
+    name = "rss"
+    priority = 2
+    
+    def __init__(self, feed_urls: Optional[List[str]] = None):
+        super().__init__(settings.rss_concurrency, settings.rss_timeout_seconds)
+        self.feed_urls = list(feed_urls if feed_urls is not None else settings.rss_feed_urls)
+    
+    async def fetch(self, client: httpx.AsyncClient) -> List[NewsCreate]:
+        results = await self.gather_limited(self._fetch_feed(client, url) for url in self.feed_urls)
+        
+        news_items = []
+        for url, result in zip(self.feed_urls, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to fetch feed {url}: {result}")
+            else:
+                news_items.extend(result)
+        return news_items
+    
+    async def _fetch_feed(self, client: httpx.AsyncClient, url: str) -> List[NewsCreate]:
+        response = await client.get(url, timeout=self.timeout, follow_redirects=True)
+        response.raise_for_status()
+        return self.parse_feed(response.content, url)
+    
+    def parse_feed(self, content: bytes, feed_url: str = "") -> List[NewsCreate]:
+        root = ET.fromstring(content)
+        
+        if root.tag == f"{ATOM}feed":
+            source = self._source_name(root.findtext(f"{ATOM}title"), feed_url)
+            entries = [self._parse_atom_entry(entry, source) for entry in root.iter(f"{ATOM}entry")]
+        else:
+            channel = root.find("channel")
+            source = self._source_name(channel.findtext("title") if channel is not None else None, feed_url)
+            entries = [self._parse_rss_item(item, source) for item in root.iter("item")]
+        
+        return [entry for entry in entries if entry is not None]
+    
+    def _parse_rss_item(self, item: ET.Element, source: str) -> Optional[NewsCreate]:
+        link = (item.findtext("link") or item.findtext("guid") or "").strip()
+        if not link:
+            return None
+        
+        return self._build_item(
+            title=item.findtext("title"),
+            body=item.findtext("description"),
+            source=source,
+            url=link,
+            published_at=_parse_rfc822(item.findtext("pubDate")),
+        )
+    
+    def _parse_atom_entry(self, entry: ET.Element, source: str) -> Optional[NewsCreate]:
+        link = _atom_link(entry) or (entry.findtext(f"{ATOM}id") or "").strip()
+        if not link:
+            return None
+        
+        return self._build_item(
+            title=entry.findtext(f"{ATOM}title"),
+            body=entry.findtext(f"{ATOM}summary") or entry.findtext(f"{ATOM}content"),
+            source=source,
+            url=link,
+            published_at=_parse_iso(entry.findtext(f"{ATOM}published") or entry.findtext(f"{ATOM}updated")),
+        )
+    
+    def _build_item(self, title, body, source, url, published_at) -> NewsCreate:
+        title = clean_text(title) or "No title"
+        body = clean_text(body) or title
+        return NewsCreate(
+            title=title,
+            body=body,
+            summary=body[:200],
+            source=source,
+            url=url,
+            published_at=published_at,
+            priority=self.priority,
+        )
+    
+    def _source_name(self, title: str | None, feed_url: str) -> str:
+        return clean_text(title) or urlparse(feed_url).netloc or "rss"
+
+
+def _atom_link(entry: ET.Element) -> str:
+    for link in entry.findall(f"{ATOM}link"):
+        if link.get("rel", "alternate") == "alternate" and link.get("href"):
+            return link.get("href").strip()
+    return ""
+
+
+def _parse_rfc822(value: str | None) -> datetime:
+    try:
+        parsed = parsedate_to_datetime(value.strip())
+    except (TypeError, ValueError, AttributeError):
+        return datetime.now(UTC)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
+
+
+def _parse_iso(value: str | None) -> datetime:
+    try:
+        parsed = datetime.fromisoformat(value.strip().replace('Z', '+00:00'))
+    except (ValueError, AttributeError):
+        return datetime.now(UTC)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
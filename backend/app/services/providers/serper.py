@@ -0,0 +1,24 @@
+from typing import List, Optional
+
+import httpx
+
+from app.core.config import settings
+from app.schemas.news import NewsCreate
+from app.services import news_fetcher
+from app.services.providers.base import SourceProvider
+
+
+class SerperProvider(SourceProvider):
+    name = "serper"
+    
+    def __init__(self, queries: Optional[List[str]] = None, use_cache: bool = True):
+        super().__init__(
+            settings.serper_concurrency,
+            settings.serper_fetch_deadline_seconds + settings.serper_timeout_seconds
+        )
+        self.queries = queries
+        self.use_cache = use_cache
+    
+    async def fetch(self, client: httpx.AsyncClient) -> List[NewsCreate]:
+        fetcher = news_fetcher.NewsFetcher(settings.serper_api_key, client, use_cache=self.use_cache)
+        return await fetcher.fetch_news(self.queries)
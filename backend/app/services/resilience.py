@@ -0,0 +1,108 @@
+import asyncio
+import logging
+import random
+import time
+from datetime import datetime, UTC
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+
+
+class CircuitOpenError(Exception):
+    pass
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._updated_at = time.monotonic()
+    
+    async def acquire(self):
+        if self.rate <= 0:
+            return
+        
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+        self._tokens -= 1
+        
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self.rate)
+
+
+class CircuitBreaker:
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+    
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+    
+    def before_call(self):
+        state = self.state
+        if state == "open" or (state == "half_open" and self._trial_in_flight):
+            raise CircuitOpenError("Circuit breaker is open, failing fast")
+        if state == "half_open":
+            self._trial_in_flight = True
+    
+    def release_trial(self):
+        self._trial_in_flight = False
+    
+    def record_success(self):
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+    
+    def record_failure(self):
+        self._failures += 1
+        if self._trial_in_flight or (self.failure_threshold > 0 and self._failures >= self.failure_threshold):
+            if self._opened_at is None or self._trial_in_flight:
+                logger.warning(f"Circuit breaker opened after {self._failures} consecutive failures")
+            self._opened_at = time.monotonic()
+        self._trial_in_flight = False
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+
+
+def backoff_delay(attempt: int, base_delay: float, max_delay: float, retry_after: Optional[float] = None) -> float:
+    if retry_after is not None:
+        return min(retry_after, max_delay)
+    return random.uniform(0, min(max_delay, base_delay * 2 ** attempt))
+
+
+serper_rate_limiter = TokenBucket(settings.serper_rate_limit_per_second, settings.serper_rate_limit_burst)
+serper_circuit_breaker = CircuitBreaker(
+    settings.serper_circuit_failure_threshold,
+    settings.serper_circuit_reset_seconds,
+)
@@ -1,91 +1,174 @@
 import logging
 import json
+import time
+from itertools import chain
 from pathlib import Path
-from apscheduler.schedulers.background import BackgroundScheduler
+from typing import List, Optional
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
 from app.core.database import SessionLocal
-from app.services.news_fetcher import fetch_and_save_news
+from app.core.metrics import EXPORT_BYTES, EXPORT_DURATION, EXPORT_LAST_BYTES
 from app.models.news import News
+from app.services.snapshot_files import atomic_file, read_json_lines, write_json_lines, write_snapshot_artifacts
 
 logger = logging.getLogger(__name__)
 
-scheduler = BackgroundScheduler()
+scheduler: Optional[AsyncIOScheduler] = None
 
 
-async def scheduled_news_fetch():
-    logger.info("Starting scheduled news fetch")
+async def scheduled_news_fetch(
+    trigger: str = "scheduler",
+    queries: Optional[List[str]] = None,
+    providers: Optional[List[str]] = None
+):
+    from app.services.jobs import fetch_jobs
+    
+    logger.info(f"Starting scheduled news fetch ({trigger})")
+    job, created = fetch_jobs.submit(trigger, queries, providers)
+    while not created:
+        await fetch_jobs.wait(job)
+        job, created = fetch_jobs.submit(trigger, queries, providers)
+    await fetch_jobs.wait(job)
+    
+    if job.status == "succeeded":
+        logger.info(f"Scheduled fetch ({trigger}) complete: {job.saved} new, {job.duplicates} duplicates")
+    else:
+        logger.error(f"Scheduled fetch ({trigger}) {job.status}: {job.error}")
+
+
+def export_news_snapshot(incremental: bool = True):
     db = SessionLocal()
     try:
-        saved, duplicates = await fetch_and_save_news(db)
-        logger.info(f"Scheduled fetch complete: {saved} new, {duplicates} duplicates")
-        
-        export_news_to_json(db)
-    except Exception as e:
-        logger.error(f"Error in scheduled fetch: {e}")
+        export_news_to_json(db, incremental=incremental)
     finally:
         db.close()
 
 
-def export_news_to_json(db: Session):
+EXPORT_COLUMNS = [
+    News.id,
+    News.title,
+    News.body,
+    News.summary,
+    News.source,
+    News.url,
+    News.published_at,
+    News.created_at,
+    News.hn_id,
+    News.score,
+    News.comments_count,
+    News.priority,
+    News.image_url,
+    News.search_position,
+    News.from_serper,
+]
+
+
+def export_news_to_json(db: Session, incremental: bool = False):
+    started = time.perf_counter()
     try:
-        news_items = db.query(News).order_by(News.created_at.desc()).all()
-        
-        news_data = []
-        for item in news_items:
-            news_data.append({
-                "id": item.id,
-                "title": item.title,
-                "body": item.body,
-                "summary": item.summary,
-                "source": item.source,
-                "url": item.url,
-                "published_at": item.published_at.isoformat() if item.published_at else None,
-                "created_at": item.created_at.isoformat() if item.created_at else None,
-                "hn_id": item.hn_id,
-                "score": item.score,
-                "comments_count": item.comments_count,
-                "priority": item.priority,
-                "image_url": item.image_url,
-                "search_position": item.search_position,
-                "from_serper": item.from_serper
-            })
-        
         json_path = Path(settings.frontend_json_path)
         json_path.parent.mkdir(parents=True, exist_ok=True)
+        state_path = json_path.with_name(f".{json_path.name}.state")
+        
+        state = _read_export_state(state_path, json_path) if incremental else None
+        last_id = state["last_id"] if state else 0
+        
+        query = select(*EXPORT_COLUMNS).order_by(News.created_at.desc(), News.id.desc())
+        if state:
+            query = query.where(News.id > last_id)
+        rows = db.execute(query.execution_options(yield_per=settings.export_chunk_size))
+        
+        new_count = 0
+        separators = (",", ":") if settings.export_minify else None
         
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(news_data, f, indent=2, ensure_ascii=False)
+        def new_lines():
+            nonlocal new_count, last_id
+            for row in rows:
+                new_count += 1
+                last_id = max(last_id, row.id)
+                yield json.dumps(_row_to_dict(row), ensure_ascii=False, separators=separators)
         
-        logger.info(f"Exported {len(news_data)} news items to {json_path}")
+        lines = new_lines()
+        if state:
+            lines = chain(lines, read_json_lines(json_path))
+        
+        with atomic_file(json_path) as f:
+            total = write_json_lines(f, lines)
+        
+        state_path.write_text(json.dumps({"last_id": last_id, "count": total}), encoding='utf-8')
+        written = write_snapshot_artifacts(json_path, total)
+        
+        written_bytes = sum(path.stat().st_size for path in [*written, state_path])
+        EXPORT_DURATION.labels(mode="incremental" if state else "full").observe(time.perf_counter() - started)
+        EXPORT_BYTES.inc(written_bytes)
+        EXPORT_LAST_BYTES.set(written_bytes)
+        
+        mode = "incrementally" if state else "fully"
+        logger.info(f"Exported {total} news items ({new_count} serialized) {mode} to {json_path}")
         
     except Exception as e:
         logger.error(f"Error exporting news to JSON: {e}")
         raise
 
 
+def _row_to_dict(row) -> dict:
+    item = row._asdict()
+    item["published_at"] = row.published_at.isoformat() if row.published_at else None
+    item["created_at"] = row.created_at.isoformat() if row.created_at else None
+    return item
+
+
+def _read_export_state(state_path: Path, json_path: Path) -> dict | None:
+    if not state_path.exists() or not json_path.exists():
+        return None
+    try:
+        return json.loads(state_path.read_text(encoding='utf-8'))
+    except ValueError:
+        return None
+
+
 def start_scheduler():
+    global scheduler
     hour = settings.scheduler_hour
     minute = settings.scheduler_minute
     
-    def job_wrapper():
-        import asyncio
-        asyncio.run(scheduled_news_fetch())
+    scheduler = AsyncIOScheduler(job_defaults={
+        "coalesce": True,
+        "max_instances": 1,
+        "misfire_grace_time": settings.scheduler_misfire_grace_seconds,
+    })
     
     scheduler.add_job(
-        job_wrapper,
+        scheduled_news_fetch,
         'cron',
         hour=hour,
         minute=minute,
+        jitter=settings.scheduler_jitter_seconds,
+        kwargs={"trigger": "daily"},
         id='daily_news_fetch'
     )
     
+    if settings.scheduler_hot_interval_minutes > 0:
+        scheduler.add_job(
+            scheduled_news_fetch,
+            'interval',
+            minutes=settings.scheduler_hot_interval_minutes,
+            jitter=settings.scheduler_jitter_seconds,
+            kwargs={"trigger": "hot", "queries": settings.serper_hot_queries, "providers": ["serper"]},
+            id='hot_news_fetch'
+        )
+    
     scheduler.start()
-    logger.info(f"Scheduler started: daily fetch at {hour:02d}:{minute:02d}")
+    logger.info(
+        f"Scheduler started: daily fetch at {hour:02d}:{minute:02d}, "
+        f"hot topics every {settings.scheduler_hot_interval_minutes} minutes"
+    )
 
 
 def shutdown_scheduler():
-    scheduler.shutdown()
+    if scheduler is not None and scheduler.running:
+        scheduler.shutdown(wait=False)
     logger.info("Scheduler shut down")
-
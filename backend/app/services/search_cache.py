@@ -0,0 +1,121 @@
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from app.core.config import BACKEND_DIR, settings
+
+logger = logging.getLogger(__name__)
+
+
+class SearchCache:
+    def __init__(self, path: str, ttl_seconds: float, max_bytes: int):
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+    
+    def get(self, query: str, num: int) -> Optional[dict]:
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT payload FROM search_cache WHERE cache_key = ?",
+                (self._key(query, num),)
+            ).fetchone()
+            if row is None:
+                return None
+            
+            self._connect().execute(
+                "UPDATE search_cache SET accessed_at = ? WHERE cache_key = ?",
+                (time.time(), self._key(query, num))
+            )
+            self._connect().commit()
+        
+        logger.info(f"Serper cache hit for query: {query}")
+        return json.loads(row[0])
+    
+    def set(self, query: str, num: int, data: dict):
+        payload = json.dumps(data).encode("utf-8")
+        now = time.time()
+        
+        with self._lock:
+            connection = self._connect()
+            connection.execute(
+                "INSERT OR REPLACE INTO search_cache "
+                "(cache_key, query, num, bucket, payload, size, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (self._key(query, num), query, num, self._bucket(), payload, len(payload), now, now)
+            )
+            connection.execute("DELETE FROM search_cache WHERE bucket < ?", (self._bucket(),))
+            self._evict(connection)
+            connection.commit()
+    
+    def size_bytes(self) -> int:
+        with self._lock:
+            return self._connect().execute("SELECT COALESCE(SUM(size), 0) FROM search_cache").fetchone()[0]
+    
+    def clear(self):
+        with self._lock:
+            self._connect().execute("DELETE FROM search_cache")
+            self._connect().commit()
+    
+    def close(self):
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+    
+    def _bucket(self) -> int:
+        return int(time.time() // self.ttl_seconds)
+    
+    def _key(self, query: str, num: int) -> str:
+        return json.dumps([query.strip().lower(), num, self._bucket()])
+    
+    def _evict(self, connection: sqlite3.Connection):
+        total = connection.execute("SELECT COALESCE(SUM(size), 0) FROM search_cache").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        
+        rows = connection.execute("SELECT cache_key, size FROM search_cache ORDER BY accessed_at").fetchall()
+        evicted = []
+        for cache_key, size in rows:
+            if total <= self.max_bytes:
+                break
+            evicted.append((cache_key,))
+            total -= size
+        connection.executemany("DELETE FROM search_cache WHERE cache_key = ?", evicted)
+        logger.info(f"Evicted {len(evicted)} Serper cache entries to stay under {self.max_bytes} bytes")
+    
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS search_cache ("
+                "cache_key TEXT PRIMARY KEY, query TEXT NOT NULL, num INTEGER NOT NULL, "
+                "bucket INTEGER NOT NULL, payload BLOB NOT NULL, size INTEGER NOT NULL, "
+                "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS ix_search_cache_accessed_at ON search_cache (accessed_at)"
+            )
+        return self._connection
+
+
+_search_cache: Optional[SearchCache] = None
+
+
+def get_search_cache() -> Optional[SearchCache]:
+    global _search_cache
+    if not settings.serper_cache_enabled or settings.serper_cache_ttl_seconds <= 0:
+        return None
+    if _search_cache is None:
+        _search_cache = SearchCache(
+            str(BACKEND_DIR / settings.serper_cache_path),
+            settings.serper_cache_ttl_seconds,
+            settings.serper_cache_max_bytes,
+        )
+    return _search_cache
@@ -0,0 +1,170 @@
+import gzip
+import json
+import logging
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from itertools import groupby
+from pathlib import Path
+from typing import Iterable, Iterator, List, Tuple
+
+from app.core.config import settings
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+COPY_CHUNK_SIZE = 1024 * 1024
+SHARD_PATTERNS = ("page-*.json*", "day-*.json*")
+
+
+def _default_file_mode() -> int:
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+FILE_MODE = _default_file_mode()
+
+
+@contextmanager
+def atomic_file(path: Path, mode: str = "w"):
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        os.fchmod(fd, FILE_MODE)
+        with os.fdopen(fd, mode, **({} if "b" in mode else {"encoding": "utf-8"})) as f:
+            yield f
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
+def read_json_lines(json_path: Path) -> Iterator[str]:
+    with open(json_path, encoding='utf-8') as f:
+        for line in f:
+            line = line.rstrip("\n").rstrip(",")
+            if line not in ("[", "]", "[]", ""):
+                yield line
+
+
+def write_json_lines(f, lines: Iterable[str]) -> int:
+    count = 0
+    for line in lines:
+        f.write("[\n" if count == 0 else ",\n")
+        f.write(line)
+        count += 1
+    f.write("\n]\n" if count else "[]\n")
+    return count
+
+
+def write_compressed_siblings(path: Path) -> List[Path]:
+    written = []
+    
+    if settings.export_gzip:
+        gz_path = path.with_name(f"{path.name}.gz")
+        with open(path, "rb") as source, atomic_file(gz_path, "wb") as target:
+            with gzip.GzipFile(fileobj=target, mode="wb", compresslevel=9, mtime=0) as compressed:
+                shutil.copyfileobj(source, compressed, COPY_CHUNK_SIZE)
+        written.append(gz_path)
+    
+    if settings.export_brotli:
+        if brotli is None:
+            logger.warning("EXPORT_BROTLI is enabled but the brotli package is not installed, skipping .br files")
+        else:
+            br_path = path.with_name(f"{path.name}.br")
+            compressor = brotli.Compressor(quality=11)
+            with open(path, "rb") as source, atomic_file(br_path, "wb") as target:
+                while chunk := source.read(COPY_CHUNK_SIZE):
+                    target.write(compressor.process(chunk))
+                target.write(compressor.finish())
+            written.append(br_path)
+    
+    return written
+
+
+def write_snapshot_artifacts(json_path: Path, total: int) -> List[Path]:
+    data_dir = json_path.parent
+    files = [json_path, *write_compressed_siblings(json_path)]
+    
+    if settings.export_ndjson:
+        ndjson_path = json_path.with_suffix(".ndjson")
+        with atomic_file(ndjson_path) as f:
+            for line in read_json_lines(json_path):
+                f.write(line)
+                f.write("\n")
+        files += [ndjson_path, *write_compressed_siblings(ndjson_path)]
+    
+    shards, shard_files = write_shards(json_path)
+    
+    meta_path = data_dir / "meta.json"
+    meta = _read_meta(meta_path)
+    meta.update({
+        "last_updated": datetime.now(UTC).isoformat(),
+        "count": total,
+        "files": [path.relative_to(data_dir).as_posix() for path in files],
+        "shard_mode": settings.export_shard_mode,
+        "shards": shards,
+    })
+    with atomic_file(meta_path) as f:
+        json.dump(meta, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+    
+    logger.info(f"Wrote {len(files)} snapshot files and {len(shards)} shards next to {json_path}")
+    return [*files, *shard_files, meta_path]
+
+
+def write_shards(json_path: Path) -> Tuple[List[dict], List[Path]]:
+    shard_dir = json_path.parent / json_path.stem
+    mode = settings.export_shard_mode
+    
+    shards = []
+    written = []
+    if mode != "none":
+        shard_dir.mkdir(parents=True, exist_ok=True)
+        for name, lines in _shard_groups(read_json_lines(json_path), mode):
+            shard_path = shard_dir / f"{name}.json"
+            with atomic_file(shard_path) as f:
+                count = write_json_lines(f, lines)
+            written += [shard_path, *write_compressed_siblings(shard_path)]
+            shard = {"file": shard_path.relative_to(json_path.parent).as_posix(), "count": count}
+            if mode == "day":
+                shard["day"] = name.removeprefix("day-")
+            shards.append(shard)
+    
+    _remove_stale_shards(shard_dir, {Path(shard["file"]).name for shard in shards})
+    return shards, written
+
+
+def _shard_groups(lines: Iterator[str], mode: str):
+    if mode == "day":
+        for day, group in groupby(lines, key=lambda line: (json.loads(line).get("created_at") or "")[:10]):
+            yield f"day-{day or 'unknown'}", group
+        return
+    
+    size = max(1, settings.export_shard_size)
+    for page, group in groupby(enumerate(lines), key=lambda item: item[0] // size):
+        yield f"page-{page + 1:04d}", (line for _, line in group)
+
+
+def _remove_stale_shards(shard_dir: Path, keep: set):
+    if not shard_dir.is_dir():
+        return
+    for pattern in SHARD_PATTERNS:
+        for path in shard_dir.glob(pattern):
+            base = path.name.removesuffix(".gz").removesuffix(".br")
+            if base not in keep:
+                path.unlink()
+
+
+def _read_meta(meta_path: Path) -> dict:
+    try:
+        meta = json.loads(meta_path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    return meta if isinstance(meta, dict) else {}
@@ -0,0 +1,113 @@
+import re
+from collections import Counter
+from datetime import date
+from typing import Dict, Iterable, List, Tuple
+
+from sqlalchemy import select, update
+from sqlalchemy.dialects import postgresql, sqlite
+
+AI_WORDS = {
+    'ai', 'machine', 'learning', 'neural', 'network', 'deep', 'artificial intelligence',
+    'nvidia', 'openai', 'google', 'meta', 'microsoft', 'apple', 'amazon', 'tesla', 'spacex', 'nasa',
+    'nlp', 'llm', 'gpt', 'llama', 'chatgpt', 'gpt-4', 'gpt-3.5', 'gpt-3', 'gpt-2', 'gpt-1', 'gpt-0',
+    'claude', 'groq', 'grok', 'grok-2', 'grok-1', 'grok-0',
+    'transformer', 'bert', 'roberta', 'attention', 'reinforcement', 'vision', 'computer', 'mlops',
+    'embeddings', 'vector', 'tensor', 'pytorch', 'tensorflow', 'keras', 'jax', 'huggingface', 'anthropic',
+    'cohere', 'gemini', 'mistral', 'diffusion', 'stable', 'midjourney', 'dall-e', 'sora', 'multimodal',
+    'rag', 'retrieval', 'augmented', 'generation', 'agentic', 'agent', 'fine-tuning', 'prompt', 'token',
+    'tokenizer', 'semantic', 'reasoning', 'hallucination', 'bias', 'safety', 'alignment', 'ethics',
+    'synthetic', 'data', 'dataset', 'training', 'inference', 'latency', 'quantization', 'bfloat16',
+    'autoregressive', 'generative', 'foundation', 'model', 'modality', 'perplexity', 'parameter',
+    'billion', 'trillion', 'mixtral', 'optimization', 'gradient', 'backpropagation'
+}
+
+STOP_WORDS = {
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'has', 'he',
+    'in', 'is', 'it', 'its', 'of', 'on', 'that', 'the', 'to', 'was', 'were',
+    'will', 'with', 'this', 'but', 'they', 'have', 'had', 'what', 'when',
+    'where', 'who', 'which', 'why', 'how', 'all', 'any', 'both', 'each', 'few',
+    'more', 'most', 'other', 'some', 'such', 'no', 'nor', 'not', 'only', 'own',
+    'same', 'so', 'than', 'too', 'very', 'can', 'just', 'should', 'now', 'our',
+    'your', 'their', 'there', 'here', 'whom', 'these', 'those', 'my', 'his', 'her',
+    'whoever', 'whomever', 'whatever', 'whichever', 'you'
+}
+
+MIN_WORD_LENGTH = 3
+MIN_WORD_FREQUENCY = 2
+COMMON_TAGS = 5
+RARE_TAGS = 3
+
+WORD_SPLIT_PATTERN = re.compile(r"\W+", re.ASCII)
+
+
+def extract_terms(title: str, body: str) -> Counter:
+    words = WORD_SPLIT_PATTERN.split(f"{title} {body}".lower())
+    return Counter(
+        word for word in words
+        if len(word) >= MIN_WORD_LENGTH
+        and word not in STOP_WORDS
+        and not word.isdigit()
+        and word in AI_WORDS
+    )
+
+
+def term_counts(documents: Iterable[Tuple[date, str, str, str]]) -> Dict[Tuple[date, str, str], int]:
+    counts = Counter()
+    for day, source, title, body in documents:
+        for term, count in extract_terms(title, body).items():
+            counts[(day, source, term)] += count
+    return dict(counts)
+
+
+def term_stat_rows(documents: Iterable[Tuple[date, str, str, str]]) -> List[dict]:
+    return [
+        {"day": day, "source": source, "term": term, "count": count}
+        for (day, source, term), count in term_counts(documents).items()
+    ]
+
+
+def pick_tags(frequencies: List[Tuple[str, int]]) -> List[str]:
+    ranked = sorted(
+        (item for item in frequencies if item[1] >= MIN_WORD_FREQUENCY),
+        key=lambda item: (-item[1], item[0])
+    )
+    return [term for term, _ in ranked[:COMMON_TAGS + RARE_TAGS]]
+
+
+def upsert_term_stats_statement(dialect: str, values: List[dict]):
+    from app.models.news import NewsTermStat
+    
+    if dialect not in ("postgresql", "sqlite"):
+        return None
+    
+    insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+    statement = insert(NewsTermStat).values(values)
+    return statement.on_conflict_do_update(
+        index_elements=[NewsTermStat.day, NewsTermStat.source, NewsTermStat.term],
+        set_={"count": NewsTermStat.count + statement.excluded.count}
+    )
+
+
+async def record_term_stats(db_session, documents: Iterable[Tuple[date, str, str, str]]):
+    from app.models.news import NewsTermStat
+    
+    values = term_stat_rows(documents)
+    if not values:
+        return
+    
+    statement = upsert_term_stats_statement(db_session.get_bind().dialect.name, values)
+    if statement is not None:
+        await db_session.execute(statement)
+        return
+    
+    for value in values:
+        key = (
+            (NewsTermStat.day == value["day"])
+            & (NewsTermStat.source == value["source"])
+            & (NewsTermStat.term == value["term"])
+        )
+        existing = await db_session.scalar(select(NewsTermStat.count).where(key))
+        if existing is None:
+            db_session.add(NewsTermStat(**value))
+        else:
+            await db_session.execute(update(NewsTermStat).where(key).values(count=existing + value["count"]))
@@ -0,0 +1,220 @@
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Callable, List
+
+import httpx
+import sqlalchemy
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.cache import news_cache
+from app.core.database import Base, create_async_engine_from_url, get_db
+from app.main import app
+from app.models.news import News
+from app.services import jobs
+from seed_test_data import seed_synthetic_data
+
+
+def build_scenarios(ids: List[int], cursor: str) -> List[dict]:
+    return [
+        {"name": "list", "method": "GET", "path": "/api/news", "params": {"limit": 20}},
+        {"name": "list", "method": "GET", "path": "/api/news", "params": {"limit": 100}},
+        {"name": "list", "method": "GET", "path": "/api/news", "params": {"limit": 1000}},
+        {"name": "list", "method": "GET", "path": "/api/news", "params": {"limit": 100, "view": "compact"}},
+        {"name": "list", "method": "GET", "path": "/api/news", "params": {"limit": 100, "source": "ArXiv"}},
+        {"name": "list", "method": "GET", "path": "/api/news", "params": {"limit": 100, "cursor": cursor}},
+        {"name": "list", "method": "GET", "path": "/api/news", "params": {"limit": 100, "skip": len(ids) // 2}},
+        {"name": "by_id", "method": "GET", "path": lambda rng: f"/api/news/{rng.choice(ids)}", "params": {}},
+        {"name": "search", "method": "GET", "path": "/api/news/search", "params": {"q": "diffusion model", "limit": 20}},
+        {"name": "tags", "method": "GET", "path": "/api/news/tags", "params": {}},
+        {"name": "tags", "method": "GET", "path": "/api/news/tags", "params": {"source": "ArXiv"}},
+        {"name": "fetch", "method": "POST", "path": "/api/fetch-news", "params": {}},
+    ]
+
+
+def summarize(latencies: List[float], errors: int, elapsed: float) -> dict:
+    if len(latencies) > 1:
+        cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+        p50, p95, p99 = cuts[49], cuts[94], cuts[98]
+    else:
+        p50 = p95 = p99 = latencies[0] if latencies else 0.0
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(p50 * 1000, 3),
+        "p95_ms": round(p95 * 1000, 3),
+        "p99_ms": round(p99 * 1000, 3),
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 3) if latencies else 0.0,
+        "max_ms": round(max(latencies) * 1000, 3) if latencies else 0.0,
+    }
+
+
+async def drive(client: httpx.AsyncClient, scenario: dict, total: int, concurrency: int, seed: int) -> dict:
+    rng = random.Random(seed)
+    latencies = []
+    errors = 0
+    remaining = total
+    fetch_jobs = {}
+    
+    async def worker():
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            path = scenario["path"](rng) if isinstance(scenario["path"], Callable) else scenario["path"]
+            start = time.perf_counter()
+            response = await client.request(scenario["method"], path, params=scenario["params"])
+            latencies.append(time.perf_counter() - start)
+            if response.status_code >= 400:
+                errors += 1
+            elif scenario["name"] == "fetch":
+                job_id = response.json()["job_id"]
+                fetch_jobs[job_id] = jobs.fetch_jobs.get(job_id)
+    
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    
+    for job in fetch_jobs.values():
+        await jobs.fetch_jobs.wait(job)
+        if job.status != "succeeded":
+            errors += 1
+            print(f"Fetch job {job.job_id} {job.status}: {job.error}", file=sys.stderr)
+    return summarize(latencies, errors, elapsed)
+
+
+async def run_size(args, rows: int, workdir: Path) -> List[dict]:
+    url = args.database_url or f"sqlite:///{workdir / f'bench_{rows}.db'}"
+    sync_engine = create_engine(url)
+    Base.metadata.drop_all(bind=sync_engine)
+    Base.metadata.create_all(bind=sync_engine)
+    
+    started = time.perf_counter()
+    seed_synthetic_data(rows, bind=sync_engine)
+    print(f"Seeded {rows} rows in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+    
+    with sync_engine.connect() as connection:
+        ids = list(connection.scalars(select(News.id)))
+        middle = connection.execute(
+            select(News.created_at, News.id).order_by(News.created_at.desc(), News.id.desc())
+            .offset(rows // 2).limit(1)
+        ).one()
+        dialect = connection.dialect.name
+        version = connection.scalar(select(func.sqlite_version())) if dialect == "sqlite" else None
+    sync_engine.dispose()
+    
+    from app.api.pagination import encode_cursor
+    cursor = encode_cursor(middle.created_at, middle.id)
+    
+    async_engine = create_async_engine_from_url(url)
+    session_factory = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+    
+    async def override_get_db():
+        async with session_factory() as db:
+            yield db
+    
+    app.dependency_overrides[get_db] = override_get_db
+    results = []
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for scenario in build_scenarios(ids, cursor):
+                if args.only and scenario["name"] not in args.only:
+                    continue
+                for cache in args.cache:
+                    news_cache.clear()
+                    news_cache.max_entries = args.cache_entries if cache == "warm" else 0
+                    for concurrency in args.concurrency:
+                        await drive(client, scenario, args.warmup, concurrency, args.seed)
+                        result = await drive(client, scenario, args.requests, concurrency, args.seed)
+                        path = scenario["path"] if isinstance(scenario["path"], str) else "/api/news/{id}"
+                        params = {key: value for key, value in scenario["params"].items() if key != "cursor"}
+                        if "cursor" in scenario["params"]:
+                            params["cursor"] = "middle"
+                        result = {
+                            "rows": rows,
+                            "dialect": dialect,
+                            "endpoint": f"{scenario['method']} {path}",
+                            "params": params,
+                            "cache": cache,
+                            "concurrency": concurrency,
+                            **result,
+                        }
+                        results.append(result)
+                        print(
+                            f"{rows:>8} {result['endpoint']:<26} {json.dumps(params):<42} {cache:<5} "
+                            f"c={concurrency:<3} {result['rps']:>8.1f} rps  p50 {result['p50_ms']:>8.2f}  "
+                            f"p95 {result['p95_ms']:>8.2f}  p99 {result['p99_ms']:>8.2f} ms",
+                            file=sys.stderr
+                        )
+    finally:
+        app.dependency_overrides.clear()
+        news_cache.max_entries = args.cache_entries
+        news_cache.clear()
+        await async_engine.dispose()
+    
+    for result in results:
+        result["sqlite_version"] = version
+    return results
+
+
+async def run(args) -> dict:
+    async def no_fetch(db, queries=None, use_cache=True, providers=None):
+        return 0, 0
+    
+    jobs.fetch_and_save_news = no_fetch
+    jobs.export_news_snapshot = lambda: None
+    
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for rows in args.rows:
+            results.extend(await run_size(args, rows, Path(workdir)))
+    
+    return {
+        "generated_at": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "sqlalchemy": sqlalchemy.__version__,
+        "settings": {
+            "requests": args.requests,
+            "warmup": args.warmup,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure latency and throughput of the news API endpoints")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000], help="dataset sizes, e.g. 1000 100000 1000000")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 16])
+    parser.add_argument("--requests", type=int, default=200, help="measured requests per scenario")
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--cache", choices=["cold", "warm"], nargs="+", default=["cold", "warm"])
+    parser.add_argument("--cache-entries", type=int, default=news_cache.max_entries or 256)
+    parser.add_argument("--only", nargs="+", choices=["list", "by_id", "search", "tags", "fetch"])
+    parser.add_argument("--database-url", help="benchmark against this database instead of a temporary SQLite file; its tables are dropped")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", type=Path, help="write JSON results here instead of stdout")
+    args = parser.parse_args()
+    
+    logging.disable(logging.INFO)
+    report = asyncio.run(run(args))
+    content = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(content + "\n", encoding="utf-8")
+    else:
+        print(content)
+
+
+if __name__ == "__main__":
+    main()
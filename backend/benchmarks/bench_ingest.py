@@ -0,0 +1,231 @@
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Callable, List
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.core.database import Base, create_async_engine_from_url
+from app.models import news  # noqa: F401
+from app.services.dedup import NearDuplicateIndex, signature_for
+from app.services.news_fetcher import NewsFetcher, fetch_and_save_news, save_news_items
+from tests.fake_serper import FakeSerperServer, load_recordings
+
+BENCH_QUERY = "benchmark query"
+
+
+def synthetic_payload(start: int, num: int) -> dict:
+    return {
+        "organic": [
+            {
+                "title": f"Lab {i % 97} ships model {i} with better reasoning on benchmark suite {i % 13}",
+                "snippet": f"The release {i} improves coding, math and retrieval by {i % 40} points over the previous version.",
+                "source": f"Source {i % 11}",
+                "link": f"https://bench.example.com/{i}?utm_source=serper",
+                "date": "2025-10-17T12:00:00Z" if i % 3 else None,
+                "imageUrl": f"https://bench.example.com/{i}.jpg",
+            }
+            for i in range(start, start + num)
+        ]
+    }
+
+
+def payload_for(query: str) -> dict:
+    num, index = (int(part) for part in query.rsplit(" ", 2)[-2:])
+    return synthetic_payload(index * num, num)
+
+
+def synthetic_workload(size: int, per_query: int):
+    per_query = min(size, per_query)
+    queries = [f"{BENCH_QUERY} {per_query} {i}" for i in range((size + per_query - 1) // per_query)]
+    return queries, [payload_for(query) for query in queries]
+
+
+def timed(fn: Callable, repeat: int) -> List[float]:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+async def timed_async(fn: Callable, repeat: int) -> List[float]:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await fn()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def result(stage: str, items: int, timings: List[float], **extra) -> dict:
+    median = statistics.median(timings)
+    entry = {
+        "stage": stage,
+        "items": items,
+        "runs": len(timings),
+        "median_ms": round(median * 1000, 3),
+        "min_ms": round(min(timings) * 1000, 3),
+        "per_item_us": round(median / items * 1e6, 3) if items else 0.0,
+        **extra,
+    }
+    print(
+        f"{stage:<14} {items:>6} items  median {entry['median_ms']:>10.3f} ms  "
+        f"{entry['per_item_us']:>9.2f} us/item",
+        file=sys.stderr
+    )
+    return entry
+
+
+async def fresh_session_factory(workdir: Path):
+    path = Path(tempfile.mkdtemp(dir=workdir)) / "ingest.db"
+    engine = create_async_engine_from_url(f"sqlite:///{path}")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    return engine, async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+
+async def bench_size(args, queries: List[str], payloads: List[dict], server: FakeSerperServer) -> List[dict]:
+    size = sum(len(payload.get("organic", [])) for payload in payloads)
+    fetcher = NewsFetcher("bench-key", use_cache=False)
+    results = []
+    
+    raw_dates = [item["date"] for payload in payloads for item in payload["organic"]]
+    results.append(result("parse_date", len(raw_dates), timed(
+        lambda: [fetcher._parse_date(value) for value in raw_dates], args.repeat
+    )))
+    
+    results.append(result("parse", size, timed(
+        lambda: [fetcher._parse_serper_response(payload, i) for i, payload in enumerate(payloads, 1)], args.repeat
+    )))
+    
+    items = [item for i, payload in enumerate(payloads, 1) for item in fetcher._parse_serper_response(payload, i)]
+    
+    def dedup():
+        index = NearDuplicateIndex(settings.dedup_max_simhash_distance)
+        for position, item in enumerate(items):
+            signature = signature_for(item.url, item.title, item.body)
+            if index.match(signature) is None:
+                index.add(position, signature)
+    
+    results.append(result("dedup", size, timed(dedup, args.repeat)))
+    
+    async def persist(runs: int, rerun: bool):
+        timings = []
+        for _ in range(runs):
+            engine, session_factory = await fresh_session_factory(args.workdir)
+            async with session_factory() as db:
+                if rerun:
+                    await save_news_items(db, items)
+                start = time.perf_counter()
+                await save_news_items(db, items)
+                timings.append(time.perf_counter() - start)
+            await engine.dispose()
+        return timings
+    
+    results.append(result("persist_new", size, await persist(args.repeat, rerun=False)))
+    results.append(result("persist_dupes", size, await persist(args.repeat, rerun=True)))
+    
+    settings.serper_base_url = server.url
+    settings.max_serper_searches = len(queries)
+    fetcher = NewsFetcher("bench-key", use_cache=False)
+    results.append(result("fetch", size, await timed_async(
+        lambda: fetcher.fetch_news(queries), args.repeat
+    ), requests=len(queries)))
+    
+    async def end_to_end():
+        engine, session_factory = await fresh_session_factory(args.workdir)
+        async with session_factory() as db:
+            await fetch_and_save_news(db, queries, use_cache=False)
+        await engine.dispose()
+    
+    results.append(result("fetch_and_save", size, await timed_async(end_to_end, args.repeat)))
+    
+    for entry in results:
+        entry["size"] = size
+    return results
+
+
+async def run(args) -> dict:
+    settings.news_providers = ["serper"]
+    settings.serper_cache_enabled = False
+    settings.serper_concurrency = args.concurrency
+    settings.serper_retry_base_delay_seconds = 0.01
+    settings.serper_retry_max_delay_seconds = 0.1
+    settings.serper_rate_limit_per_second = 1e9
+    settings.serper_rate_limit_burst = 10 ** 9
+    settings.serper_circuit_failure_threshold = 10 ** 9
+    
+    from app.services import resilience
+    resilience.serper_rate_limiter.rate = settings.serper_rate_limit_per_second
+    resilience.serper_rate_limiter.capacity = settings.serper_rate_limit_burst
+    resilience.serper_circuit_breaker.failure_threshold = settings.serper_circuit_failure_threshold
+    
+    recordings = load_recordings(args.replay) if args.replay else None
+    server = FakeSerperServer(
+        latency=args.latency, jitter=args.jitter, error_rate=args.error_rate, recordings=recordings, seed=args.seed
+    )
+    if recordings:
+        workloads = [(list(recordings), list(recordings.values()))]
+    else:
+        server.respond = lambda payload: (200, {}, payload_for(payload["q"]))
+        workloads = [synthetic_workload(size, args.per_query) for size in args.sizes]
+    
+    results = []
+    with server, tempfile.TemporaryDirectory() as workdir:
+        args.workdir = Path(workdir)
+        for queries, payloads in workloads:
+            results.extend(await bench_size(args, queries, payloads, server))
+    
+    return {
+        "generated_at": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "settings": {
+            "repeat": args.repeat,
+            "per_query": args.per_query,
+            "concurrency": args.concurrency,
+            "latency": args.latency,
+            "jitter": args.jitter,
+            "error_rate": args.error_rate,
+            "replay": str(args.replay) if args.replay else None,
+        },
+        "server_requests": len(server.requests),
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time the ingest pipeline stages against a local Serper stand-in")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 10000], help="results per run")
+    parser.add_argument("--per-query", type=int, default=100, help="results returned per search request")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--concurrency", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds the stand-in waits before answering")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra random latency, up to this many seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of requests answered with 503")
+    parser.add_argument("--replay", type=Path, help="JSON file of {query: response} or a Serper cache database; replaces --sizes")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", type=Path, help="write JSON results here instead of stdout")
+    args = parser.parse_args()
+    
+    logging.disable(logging.INFO)
+    report = asyncio.run(run(args))
+    content = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(content + "\n", encoding="utf-8")
+    else:
+        print(content)
+
+
+if __name__ == "__main__":
+    main()
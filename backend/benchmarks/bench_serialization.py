@@ -0,0 +1,84 @@
+import argparse
+import statistics
+import time
+from datetime import datetime, timedelta
+from typing import List
+
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.api.serialization import dump_news_rows, select_news_rows
+from app.core.database import Base
+from app.models.news import News
+from app.schemas.news import NewsResponse
+
+news_list_adapter = TypeAdapter(List[NewsResponse])
+
+
+def seed(db, rows: int):
+    base = datetime(2025, 10, 17, 12, 0, 0)
+    db.add_all(
+        News(
+            title=f"Benchmark news item {i} about large language models",
+            body="Researchers describe a new training recipe for transformer models. " * 8,
+            summary="A new training recipe for transformer models.",
+            source=f"Source {i % 7}",
+            url=f"https://bench.example.com/news/{i}",
+            published_at=base,
+            created_at=base + timedelta(seconds=i),
+            priority=2,
+            image_url=f"https://bench.example.com/images/{i}.jpg",
+            search_position=i % 5,
+            from_serper=True,
+        )
+        for i in range(rows)
+    )
+    db.commit()
+
+
+def orm_pydantic_path(db, limit: int) -> bytes:
+    items = db.query(News).order_by(News.created_at.desc(), News.id.desc()).limit(limit).all()
+    return news_list_adapter.dump_json(news_list_adapter.validate_python(items, from_attributes=True))
+
+
+def row_orjson_path(db, limit: int) -> bytes:
+    query = select_news_rows().order_by(News.created_at.desc(), News.id.desc()).limit(limit)
+    return dump_news_rows(db.execute(query).all())
+
+
+def measure(fn, db, limit: int, repeat: int) -> List[float]:
+    timings = []
+    for _ in range(repeat):
+        db.expunge_all()
+        start = time.perf_counter()
+        fn(db, limit)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare /api/news list serialization paths")
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=30)
+    args = parser.parse_args()
+    
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    seed(db, args.rows)
+    
+    assert orm_pydantic_path(db, args.rows) == row_orjson_path(db, args.rows)
+    
+    results = {}
+    for name, fn in (("orm+pydantic", orm_pydantic_path), ("rows+orjson", row_orjson_path)):
+        timings = measure(fn, db, args.rows, args.repeat)
+        results[name] = statistics.median(timings)
+        print(f"{name:>14}: median {results[name] * 1000:8.2f} ms, best {min(timings) * 1000:8.2f} ms")
+    
+    print(f"{'speedup':>14}: {results['orm+pydantic'] / results['rows+orjson']:.1f}x for {args.rows} rows")
+
+
+if __name__ == "__main__":
+    main()
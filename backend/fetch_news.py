@@ -1,9 +1,11 @@
+import argparse
 import asyncio
 import logging
 
-from app.core.database import SessionLocal
+from app.core.database import AsyncSessionLocal, async_engine
+from app.core.http import close_http_client, start_http_client
 from app.services.news_fetcher import fetch_and_save_news
-from app.services.scheduler import export_news_to_json
+from app.services.scheduler import export_news_snapshot
 
 logging.basicConfig(
     level=logging.INFO,
@@ -13,24 +15,29 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-async def main():
+async def main(use_cache: bool = True):
     logger.info("Starting manual news fetch")
-    db = SessionLocal()
+    await start_http_client()
     
     try:
-        saved, duplicates = await fetch_and_save_news(db)
+        async with AsyncSessionLocal() as db:
+            saved, duplicates = await fetch_and_save_news(db, use_cache=use_cache)
         logger.info(f"Fetch complete: {saved} new items, {duplicates} duplicates")
         
-        export_news_to_json(db)
+        export_news_snapshot()
         logger.info("News exported to JSON successfully")
         
     except Exception as e:
         logger.error(f"Error during fetch: {e}")
         raise
     finally:
-        db.close()
+        await close_http_client()
+        await async_engine.dispose()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
-
+    parser = argparse.ArgumentParser(description="Fetch news from Serper and export it to JSON")
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the on-disk Serper response cache")
+    args = parser.parse_args()
+    
+    asyncio.run(main(use_cache=not args.no_cache))
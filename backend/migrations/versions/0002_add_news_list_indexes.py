@@ -0,0 +1,35 @@
+"""add news list indexes
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2025-10-18 09:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0002"
+down_revision: Union[str, Sequence[str], None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_news_created_at_id",
+        "news",
+        [sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+    op.create_index(
+        "ix_news_source_created_at_id",
+        "news",
+        ["source", sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_news_source_created_at_id", table_name="news")
+    op.drop_index("ix_news_created_at_id", table_name="news")
@@ -0,0 +1,156 @@
+"""add near-duplicate index
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2025-10-18 14:00:00
+
+"""
+import hashlib
+import re
+from typing import Optional, Sequence, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0003"
+down_revision: Union[str, Sequence[str], None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 1000
+
+# The backfill keeps its own copy of the signature algorithm as of this revision,
+# so later changes to app.services.dedup cannot change what this migration writes.
+SIMHASH_BITS = 64
+SIMHASH_BANDS = 4
+BAND_BITS = SIMHASH_BITS // SIMHASH_BANDS
+MIN_SIMHASH_TOKENS = 8
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "msclkid", "mc_cid", "mc_eid", "igshid", "yclid",
+    "ref", "ref_src", "ref_url", "referrer", "source", "cmpid", "ocid", "smid", "guccounter",
+}
+TRACKING_PREFIXES = ("utm_", "at_", "pk_", "_hs")
+TOKEN_PATTERN = re.compile(r"\w+")
+
+BAND_COLUMNS = [f"simhash_band_{band}" for band in range(SIMHASH_BANDS)]
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("news") as batch_op:
+        batch_op.add_column(sa.Column("canonical_url", sa.String(), nullable=True))
+        batch_op.add_column(sa.Column("simhash", sa.BigInteger(), nullable=True))
+        for column in BAND_COLUMNS:
+            batch_op.add_column(sa.Column(column, sa.Integer(), nullable=True))
+    
+    _backfill_signatures()
+    
+    op.create_index("ix_news_canonical_url", "news", ["canonical_url"])
+    for column in BAND_COLUMNS:
+        op.create_index(f"ix_news_{column}", "news", [column])
+    
+    op.create_table(
+        "news_duplicates",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("news_id", sa.Integer(), nullable=False),
+        sa.Column("url", sa.String(), nullable=False),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("source", sa.String(), nullable=False),
+        sa.Column("distance", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["news_id"], ["news.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("url"),
+    )
+    op.create_index("ix_news_duplicates_news_id", "news_duplicates", ["news_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_news_duplicates_news_id", table_name="news_duplicates")
+    op.drop_table("news_duplicates")
+    
+    for column in reversed(BAND_COLUMNS):
+        op.drop_index(f"ix_news_{column}", table_name="news")
+    op.drop_index("ix_news_canonical_url", table_name="news")
+    
+    with op.batch_alter_table("news") as batch_op:
+        for column in reversed(BAND_COLUMNS):
+            batch_op.drop_column(column)
+        batch_op.drop_column("simhash")
+        batch_op.drop_column("canonical_url")
+
+
+def _backfill_signatures() -> None:
+    connection = op.get_bind()
+    news = sa.table(
+        "news",
+        sa.column("id", sa.Integer),
+        sa.column("url", sa.String),
+        sa.column("title", sa.String),
+        sa.column("body", sa.Text),
+        sa.column("canonical_url", sa.String),
+        sa.column("simhash", sa.BigInteger),
+        *(sa.column(column, sa.Integer) for column in BAND_COLUMNS),
+    )
+    update = (
+        news.update()
+        .where(news.c.id == sa.bindparam("news_id"))
+        .values({column: sa.bindparam(column) for column in ["canonical_url", "simhash", *BAND_COLUMNS]})
+    )
+    
+    last_id = 0
+    while True:
+        rows = connection.execute(
+            sa.select(news.c.id, news.c.url, news.c.title, news.c.body)
+            .where(news.c.id > last_id)
+            .order_by(news.c.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        
+        connection.execute(update, [
+            {"news_id": row.id, **_signature_columns(row.url, row.title, row.body)}
+            for row in rows
+        ])
+        last_id = rows[-1].id
+
+
+def _signature_columns(url: str, title: str, body: str) -> dict:
+    fingerprint = _simhash(f"{title} {body}")
+    columns = {"canonical_url": _canonicalize_url(url), "simhash": fingerprint}
+    unsigned = fingerprint % (1 << SIMHASH_BITS) if fingerprint is not None else None
+    for band, column in enumerate(BAND_COLUMNS):
+        columns[column] = unsigned >> (band * BAND_BITS) & ((1 << BAND_BITS) - 1) if unsigned is not None else None
+    return columns
+
+
+def _canonicalize_url(url: str) -> str:
+    parts = urlsplit(url.strip())
+    host = (parts.hostname or "").lower().removeprefix("www.").removeprefix("m.")
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+    
+    path = re.sub(r"/{2,}", "/", parts.path).rstrip("/") or "/"
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    )
+    return urlunsplit(("https", host, path, urlencode(query), ""))
+
+
+def _simhash(text: str) -> Optional[int]:
+    tokens = TOKEN_PATTERN.findall(text.lower())
+    if len(tokens) < MIN_SIMHASH_TOKENS:
+        return None
+    
+    weights = [0] * SIMHASH_BITS
+    for feature in tokens:
+        value = int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=8).digest(), "big")
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += 1 if value >> bit & 1 else -1
+    
+    fingerprint = sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+    return fingerprint - (1 << SIMHASH_BITS) if fingerprint >= 1 << (SIMHASH_BITS - 1) else fingerprint
@@ -0,0 +1,39 @@
+"""add news search vector
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2025-10-18 16:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "0004"
+down_revision: Union[str, Sequence[str], None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    
+    op.execute("""
+        ALTER TABLE news ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(summary, '')), 'B') ||
+            setweight(to_tsvector('english', coalesce(body, '')), 'C')
+        ) STORED
+    """)
+    op.execute("CREATE INDEX IF NOT EXISTS ix_news_search_vector ON news USING gin (search_vector)")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    
+    op.execute("DROP INDEX IF EXISTS ix_news_search_vector")
+    op.execute("ALTER TABLE news DROP COLUMN IF EXISTS search_vector")
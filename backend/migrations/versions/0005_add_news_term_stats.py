@@ -0,0 +1,115 @@
+"""add news term stats
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2025-10-18 18:00:00
+
+"""
+import re
+from collections import Counter
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0005"
+down_revision: Union[str, Sequence[str], None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 1000
+
+# The backfill keeps its own copy of the tokenizer as of this revision, so later
+# changes to app.services.tags cannot change what this migration writes.
+AI_WORDS = {
+    'ai', 'machine', 'learning', 'neural', 'network', 'deep', 'artificial intelligence',
+    'nvidia', 'openai', 'google', 'meta', 'microsoft', 'apple', 'amazon', 'tesla', 'spacex', 'nasa',
+    'nlp', 'llm', 'gpt', 'llama', 'chatgpt', 'gpt-4', 'gpt-3.5', 'gpt-3', 'gpt-2', 'gpt-1', 'gpt-0',
+    'claude', 'groq', 'grok', 'grok-2', 'grok-1', 'grok-0',
+    'transformer', 'bert', 'roberta', 'attention', 'reinforcement', 'vision', 'computer', 'mlops',
+    'embeddings', 'vector', 'tensor', 'pytorch', 'tensorflow', 'keras', 'jax', 'huggingface', 'anthropic',
+    'cohere', 'gemini', 'mistral', 'diffusion', 'stable', 'midjourney', 'dall-e', 'sora', 'multimodal',
+    'rag', 'retrieval', 'augmented', 'generation', 'agentic', 'agent', 'fine-tuning', 'prompt', 'token',
+    'tokenizer', 'semantic', 'reasoning', 'hallucination', 'bias', 'safety', 'alignment', 'ethics',
+    'synthetic', 'data', 'dataset', 'training', 'inference', 'latency', 'quantization', 'bfloat16',
+    'autoregressive', 'generative', 'foundation', 'model', 'modality', 'perplexity', 'parameter',
+    'billion', 'trillion', 'mixtral', 'optimization', 'gradient', 'backpropagation'
+}
+
+STOP_WORDS = {
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'has', 'he',
+    'in', 'is', 'it', 'its', 'of', 'on', 'that', 'the', 'to', 'was', 'were',
+    'will', 'with', 'this', 'but', 'they', 'have', 'had', 'what', 'when',
+    'where', 'who', 'which', 'why', 'how', 'all', 'any', 'both', 'each', 'few',
+    'more', 'most', 'other', 'some', 'such', 'no', 'nor', 'not', 'only', 'own',
+    'same', 'so', 'than', 'too', 'very', 'can', 'just', 'should', 'now', 'our',
+    'your', 'their', 'there', 'here', 'whom', 'these', 'those', 'my', 'his', 'her',
+    'whoever', 'whomever', 'whatever', 'whichever', 'you'
+}
+
+MIN_WORD_LENGTH = 3
+WORD_SPLIT_PATTERN = re.compile(r"\W+", re.ASCII)
+
+
+def upgrade() -> None:
+    term_stats = op.create_table(
+        "news_term_stats",
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("source", sa.String(), nullable=False),
+        sa.Column("term", sa.String(), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("day", "source", "term"),
+    )
+    
+    _backfill_term_stats(term_stats)
+
+
+def downgrade() -> None:
+    op.drop_table("news_term_stats")
+
+
+def _backfill_term_stats(term_stats) -> None:
+    connection = op.get_bind()
+    news = sa.table(
+        "news",
+        sa.column("id", sa.Integer),
+        sa.column("title", sa.String),
+        sa.column("body", sa.Text),
+        sa.column("source", sa.String),
+        sa.column("created_at", sa.DateTime),
+    )
+    
+    counts = Counter()
+    last_id = 0
+    while True:
+        rows = connection.execute(
+            sa.select(news.c.id, news.c.title, news.c.body, news.c.source, news.c.created_at)
+            .where(news.c.id > last_id)
+            .order_by(news.c.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        
+        for row in rows:
+            for term, count in _extract_terms(row.title, row.body).items():
+                counts[(row.created_at.date(), row.source, term)] += count
+        last_id = rows[-1].id
+    
+    if counts:
+        op.bulk_insert(term_stats, [
+            {"day": day, "source": source, "term": term, "count": count}
+            for (day, source, term), count in counts.items()
+        ])
+
+
+def _extract_terms(title: str, body: str) -> Counter:
+    words = WORD_SPLIT_PATTERN.split(f"{title} {body}".lower())
+    return Counter(
+        word for word in words
+        if len(word) >= MIN_WORD_LENGTH
+        and word not in STOP_WORDS
+        and not word.isdigit()
+        and word in AI_WORDS
+    )
@@ -1,6 +1,16 @@
-from datetime import datetime, UTC
-from app.core.database import SessionLocal
-from app.models.news import News
+import argparse
+import random
+from collections import Counter
+from datetime import datetime, timedelta, UTC
+from sqlalchemy import func, insert, select
+from app.core.database import SessionLocal, engine
+from app.models.news import News, NewsTermStat
+from app.services.tags import term_counts, upsert_term_stats_statement
+
+SYNTHETIC_SOURCES = ["TechCrunch", "ArXiv", "Nature", "MIT Technology Review", "Science Daily", "hackernews", "The Verge"]
+SYNTHETIC_SUBJECTS = ["LLM", "Transformer", "Diffusion model", "AI agent", "Neural network", "RAG pipeline", "GPU cluster"]
+SYNTHETIC_VERBS = ["beats", "reshapes", "accelerates", "cuts the cost of", "rethinks", "scales", "secures"]
+SYNTHETIC_OBJECTS = ["reasoning benchmarks", "inference latency", "model training", "code generation", "robotics", "search", "alignment research"]
 
 def seed_test_data():
     db = SessionLocal()
@@ -82,6 +92,59 @@ def seed_test_data():
         db.close()
 
 
+def seed_synthetic_data(count: int, bind=engine, batch_size: int = 10_000, seed: int = 42) -> int:
+    rng = random.Random(seed)
+    base = datetime(2025, 1, 1)
+    
+    with bind.begin() as connection:
+        start = (connection.scalar(select(func.max(News.id))) or 0) + 1
+        terms = Counter()
+        
+        for offset in range(0, count, batch_size):
+            rows = []
+            for i in range(start + offset, start + min(offset + batch_size, count)):
+                title = f"{rng.choice(SYNTHETIC_SUBJECTS)} {rng.choice(SYNTHETIC_VERBS)} {rng.choice(SYNTHETIC_OBJECTS)} #{i}"
+                body = " ".join(rng.choice(SYNTHETIC_SUBJECTS + SYNTHETIC_OBJECTS) for _ in range(40))
+                created_at = base + timedelta(seconds=i * 30)
+                url = f"https://synthetic.example.com/news/{i}"
+                rows.append({
+                    "title": title,
+                    "body": body,
+                    "summary": body[:200],
+                    "source": rng.choice(SYNTHETIC_SOURCES),
+                    "url": url,
+                    "canonical_url": url,
+                    "published_at": created_at,
+                    "created_at": created_at,
+                    "priority": rng.randint(1, 3),
+                    "image_url": f"https://synthetic.example.com/images/{i}.jpg",
+                    "search_position": rng.randint(1, 10),
+                    "from_serper": True,
+                })
+            connection.execute(insert(News), rows)
+            terms.update(term_counts(
+                (row["created_at"].date(), row["source"], row["title"], row["body"]) for row in rows
+            ))
+        
+        values = [
+            {"day": day, "source": source, "term": term, "count": count}
+            for (day, source, term), count in terms.items()
+        ]
+        for offset in range(0, len(values), 1000):
+            chunk = values[offset:offset + 1000]
+            statement = upsert_term_stats_statement(connection.dialect.name, chunk)
+            connection.execute(statement if statement is not None else insert(NewsTermStat).values(chunk))
+    
+    return count
+
+
 if __name__ == "__main__":
-    seed_test_data()
+    parser = argparse.ArgumentParser(description="Seed the database with test news items")
+    parser.add_argument("--synthetic", type=int, metavar="N", help="insert N generated rows instead of the fixed samples")
+    args = parser.parse_args()
+    
+    if args.synthetic:
+        print(f"Successfully seeded {seed_synthetic_data(args.synthetic)} synthetic news items")
+    else:
+        seed_test_data()
 
@@ -1,9 +1,15 @@
+from contextlib import contextmanager
+
 import pytest
-from sqlalchemy import create_engine
+import pytest_asyncio
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.orm import sessionmaker
 from fastapi.testclient import TestClient
 
-from app.core.database import Base, get_db
+from app.core.cache import news_cache
+from app.core.config import settings
+from app.core.database import Base, create_async_engine_from_url, get_db
 from app.main import app
 
 SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
@@ -11,6 +17,21 @@ SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
 engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+async_engine = create_async_engine_from_url(SQLALCHEMY_DATABASE_URL)
+TestingAsyncSessionLocal = async_sessionmaker(
+    async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
+
+
+@pytest.fixture(autouse=True)
+def disable_search_cache(monkeypatch):
+    monkeypatch.setattr(settings, "serper_cache_enabled", False)
+
+
+@pytest.fixture(autouse=True)
+def serper_only_providers(monkeypatch):
+    monkeypatch.setattr(settings, "news_providers", ["serper"])
+
 
 @pytest.fixture
 def db_session():
@@ -23,16 +44,45 @@ def db_session():
         Base.metadata.drop_all(bind=engine)
 
 
+@pytest_asyncio.fixture
+async def async_db_session(db_session):
+    async with TestingAsyncSessionLocal() as db:
+        yield db
+
+
 @pytest.fixture
 def client(db_session):
-    def override_get_db():
-        try:
-            yield db_session
-        finally:
-            pass
+    async def override_get_db():
+        async with TestingAsyncSessionLocal() as db:
+            yield db
     
     app.dependency_overrides[get_db] = override_get_db
+    news_cache.clear()
     with TestClient(app) as test_client:
         yield test_client
     app.dependency_overrides.clear()
 
+
+@pytest.fixture
+def assert_max_queries():
+    @contextmanager
+    def check(limit: int):
+        statements = []
+        
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+        
+        engines = [engine, async_engine.sync_engine]
+        for target in engines:
+            event.listen(target, "before_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            for target in engines:
+                event.remove(target, "before_cursor_execute", record)
+        
+        assert len(statements) <= limit, (
+            f"Expected at most {limit} SQL statements, got {len(statements)}:\n" + "\n".join(statements)
+        )
+    
+    return check
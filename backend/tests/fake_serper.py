@@ -0,0 +1,121 @@
+import json
+import random
+import sqlite3
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Optional
+
+
+def organic_results(query: str, num: int = 10) -> dict:
+    slug = query.lower().replace(" ", "-")
+    return {
+        "organic": [
+            {
+                "title": f"{query} result {i}",
+                "snippet": f"Snippet {i} about {query}",
+                "source": "Fake Serper",
+                "link": f"https://fake.example.com/{slug}/{i}",
+                "date": "2025-10-17T12:00:00Z",
+            }
+            for i in range(num)
+        ]
+    }
+
+
+def load_recordings(path) -> Dict[str, dict]:
+    path = Path(path)
+    if path.suffix in (".sqlite3", ".sqlite", ".db"):
+        connection = sqlite3.connect(path)
+        try:
+            rows = connection.execute("SELECT query, payload FROM search_cache ORDER BY created_at").fetchall()
+        finally:
+            connection.close()
+        return {query: json.loads(payload) for query, payload in rows}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+class FakeSerperServer:
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        recordings: Optional[Dict[str, dict]] = None,
+        seed: int = 0
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.recordings = recordings or {}
+        self.connections = 0
+        self.requests = []
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, args=(0.05,), daemon=True)
+    
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address
+        return f"http://{host}:{port}/search"
+    
+    def __enter__(self):
+        self._thread.start()
+        return self
+    
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
+    
+    def respond(self, payload: dict) -> tuple:
+        query = payload.get("q", "")
+        if query in self.recordings:
+            return 200, {}, self.recordings[query]
+        return 200, {}, organic_results(query, payload.get("num", 10))
+    
+    def _delay_and_fail(self) -> Optional[tuple]:
+        with self._lock:
+            delay = self.latency + self._random.uniform(0, self.jitter)
+            failed = self._random.random() < self.error_rate
+        if delay > 0:
+            time.sleep(delay)
+        if failed:
+            return self.error_status, {}, {"message": "injected failure"}
+        return None
+    
+    def _handler_class(self):
+        fake = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            
+            def setup(self):
+                super().setup()
+                with fake._lock:
+                    fake.connections += 1
+            
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                payload = json.loads(self.rfile.read(length) or b"{}")
+                with fake._lock:
+                    fake.requests.append(payload)
+                
+                status, headers, body = fake._delay_and_fail() or fake.respond(payload)
+                content = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+            
+            def log_message(self, format, *args):
+                pass
+        
+        return Handler
@@ -0,0 +1,81 @@
+import asyncio
+from datetime import datetime
+
+from app.core.cache import TTLCache, news_cache
+from app.models.news import News
+from app.schemas.news import NewsCreate
+from app.services import news_fetcher
+from tests.conftest import TestingAsyncSessionLocal
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(max_entries=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    
+    cache.set("c", 3)
+    
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_ttl_cache_expires_entries(monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr("app.core.cache.time.monotonic", lambda: now)
+    cache = TTLCache(max_entries=10, ttl_seconds=5)
+    cache.set("a", 1)
+    
+    now += 4
+    assert cache.get("a") == 1
+    now += 2
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache_disabled():
+    cache = TTLCache(max_entries=10, ttl_seconds=0)
+    cache.set("a", 1)
+    assert cache.get("a") is None
+
+
+def test_news_list_cached_until_ingest(client, db_session, monkeypatch):
+    def add_news(i):
+        db_session.add(News(
+            title=f"News {i}",
+            body="Body",
+            summary="Summary",
+            source="Source",
+            url=f"https://test.com/cached{i}",
+            published_at=datetime.now(),
+            created_at=datetime.now()
+        ))
+        db_session.commit()
+    
+    add_news(0)
+    assert len(client.get("/api/news").json()) == 1
+    
+    add_news(1)
+    assert len(client.get("/api/news").json()) == 1
+    assert len(client.get("/api/news?limit=50").json()) == 2
+    
+    async def fake_fetch_news(self, queries=None):
+        return [NewsCreate(
+            title="Fetched",
+            body="Body",
+            summary="Summary",
+            source="Source",
+            url="https://test.com/fetched",
+            published_at=datetime.now()
+        )]
+    
+    async def ingest():
+        async with TestingAsyncSessionLocal() as db:
+            return await news_fetcher.fetch_and_save_news(db)
+    
+    monkeypatch.setattr(news_fetcher.NewsFetcher, "fetch_news", fake_fetch_news)
+    assert asyncio.run(ingest()) == (1, 0)
+    
+    assert len(news_cache) == 0
+    assert len(client.get("/api/news").json()) == 3
@@ -0,0 +1,39 @@
+from app.services.dedup import (
+    NearDuplicateIndex,
+    canonicalize_url,
+    hamming_distance,
+    signature_for,
+    simhash,
+    simhash_bands,
+)
+
+STORY = "OpenAI releases a new reasoning model that beats previous benchmarks on math and coding tasks"
+
+
+def test_canonicalize_url_strips_tracking_and_normalizes():
+    assert canonicalize_url("http://www.Example.com/story/?utm_source=x&b=2&a=1&fbclid=y#top") == \
+        "https://example.com/story?a=1&b=2"
+    assert canonicalize_url("https://example.com/story") == canonicalize_url("https://m.example.com/story/")
+    assert canonicalize_url("https://example.com/story?id=1") != canonicalize_url("https://example.com/story?id=2")
+
+
+def test_simhash_is_stable_and_close_for_near_duplicates():
+    assert simhash(STORY) == simhash(STORY.upper())
+    assert hamming_distance(simhash(STORY), simhash(STORY + " today")) <= 3
+    assert hamming_distance(simhash(STORY), simhash("Google unveils a protein folding system for every known molecule")) > 3
+    assert simhash("Too short") is None
+
+
+def test_simhash_fits_signed_64_bit_column():
+    fingerprint = simhash(STORY)
+    assert -(1 << 63) <= fingerprint < 1 << 63
+    assert all(0 <= band < 1 << 16 for band in simhash_bands(fingerprint))
+
+
+def test_near_duplicate_index_matches_url_and_fingerprint():
+    index = NearDuplicateIndex(max_distance=3)
+    index.add("original", signature_for("https://example.com/a", STORY, ""))
+    
+    assert index.match(signature_for("https://example.com/a?utm_medium=rss", "Other", "title")) == ("original", 0)
+    assert index.match(signature_for("https://mirror.example.org/b", STORY, "today"))[0] == "original"
+    assert index.match(signature_for("https://example.com/c", "Unrelated short", "")) is None
@@ -1,10 +1,12 @@
 import asyncio
+import time
 import pytest
 from fastapi.testclient import TestClient
 
 from app.main import app
 from app.core.database import SessionLocal, engine, Base
 from app.models.news import News
+from app.services import jobs
 
 client = TestClient(app)
 
@@ -44,15 +46,24 @@ def test_get_news_pagination():
     assert len(data) <= 10
 
 
-def test_fetch_news_endpoint_without_api_key():
-    import os
-    original_key = os.environ.get('SERPER_API_KEY')
+def test_fetch_news_endpoint_without_api_key(client, monkeypatch):
+    async def fake_fetch_and_save_news(db, queries=None, use_cache=True, providers=None):
+        raise RuntimeError("SERPER_API_KEY is not configured")
     
-    if original_key and original_key != 'your_api_key_here':
-        pytest.skip("Skipping test - real API key present")
+    monkeypatch.setattr(jobs, "fetch_and_save_news", fake_fetch_and_save_news)
+    monkeypatch.setattr(jobs, "export_news_snapshot", lambda: None)
     
     response = client.post("/api/fetch-news")
-    assert response.status_code in [200, 500]
+    assert response.status_code == 202
+    job_id = response.json()["job_id"]
+    
+    for _ in range(100):
+        job = client.get(f"/api/fetch-news/{job_id}").json()
+        if job["status"] not in ("queued", "running"):
+            break
+        time.sleep(0.02)
+    assert job["status"] == "failed"
+    assert job["error"] == "SERPER_API_KEY is not configured"
 
 
 def test_api_cors_headers():
@@ -0,0 +1,86 @@
+import pytest
+from prometheus_client import REGISTRY
+
+from app.core.config import settings
+from app.core.http import create_http_client
+from app.services import jobs
+from app.services.news_fetcher import fetch_and_save_news
+from app.services.scheduler import export_news_to_json
+from tests.conftest import TestingAsyncSessionLocal
+from tests.fake_serper import FakeSerperServer
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_metrics_endpoint_reports_route_latency(client):
+    before = sample("http_request_duration_seconds_count", method="GET", route="/api/news/{news_id}", status="404")
+    
+    assert client.get("/api/news/12345").status_code == 404
+    response = client.get("/metrics")
+    
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'route="/api/news/{news_id}"' in response.text
+    assert sample(
+        "http_request_duration_seconds_count", method="GET", route="/api/news/{news_id}", status="404"
+    ) == before + 1
+
+
+def test_metrics_endpoint_can_be_disabled(client, monkeypatch):
+    monkeypatch.setattr(settings, "metrics_enabled", False)
+    assert client.get("/metrics").status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_fetch_and_save_news_records_serper_and_item_metrics(db_session, monkeypatch):
+    monkeypatch.setattr(settings, "http2_enabled", False)
+    monkeypatch.setattr(settings, "serper_max_retries", 0)
+    before = {
+        outcome: sample("news_items_total", outcome=outcome) for outcome in ("collected", "saved", "duplicate")
+    }
+    save_count = sample("news_ingest_stage_duration_seconds_count", stage="save")
+    
+    with FakeSerperServer() as server:
+        monkeypatch.setattr(settings, "serper_base_url", server.url)
+        async with create_http_client() as client:
+            monkeypatch.setattr("app.services.news_fetcher.get_http_client", lambda: client)
+            async with TestingAsyncSessionLocal() as db:
+                await fetch_and_save_news(db, ["metrics query"])
+                await fetch_and_save_news(db, ["metrics query"])
+    
+    assert sample("serper_request_duration_seconds_count", query="metrics query", status="200") >= 2
+    assert sample("news_items_total", outcome="collected") == before["collected"] + 20
+    assert sample("news_items_total", outcome="saved") == before["saved"] + 10
+    assert sample("news_items_total", outcome="duplicate") == before["duplicate"] + 10
+    assert sample("news_ingest_stage_duration_seconds_count", stage="save") == save_count + 2
+
+
+def test_export_records_duration_and_bytes(db_session, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "frontend_json_path", str(tmp_path / "news.json"))
+    before = sample("news_export_duration_seconds_count", mode="full")
+    bytes_before = sample("news_export_bytes_total")
+    
+    export_news_to_json(db_session)
+    
+    written = sum(path.stat().st_size for path in tmp_path.rglob("*") if path.is_file())
+    assert sample("news_export_duration_seconds_count", mode="full") == before + 1
+    assert sample("news_export_last_bytes") == written
+    assert sample("news_export_bytes_total") == bytes_before + written
+
+
+@pytest.mark.asyncio
+async def test_successful_fetch_job_records_last_success(monkeypatch):
+    async def fake_fetch_and_save_news(db, queries=None, use_cache=True, providers=None):
+        return 0, 0
+    
+    monkeypatch.setattr(jobs, "fetch_and_save_news", fake_fetch_and_save_news)
+    monkeypatch.setattr(jobs, "export_news_snapshot", lambda: None)
+    manager = jobs.FetchJobManager()
+    
+    job, _ = manager.submit("daily")
+    await manager.wait(job)
+    
+    assert job.status == "succeeded"
+    assert sample("news_fetch_last_success_timestamp_seconds", trigger="daily") >= job.started_at.timestamp()
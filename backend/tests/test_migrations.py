@@ -0,0 +1,109 @@
+from datetime import date
+
+from alembic import command
+from alembic.script import ScriptDirectory
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.dialects import sqlite
+
+from app.core.migrations import BASELINE_REVISION, get_alembic_config, run_migrations, schema_differences
+from app.models.news import News
+from app.services.dedup import signature_for
+from app.services.tags import term_counts
+
+
+def _index_names(engine):
+    return {index["name"] for index in inspect(engine).get_indexes("news")}
+
+
+def test_migrations_match_models(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'migrated.db'}")
+    
+    run_migrations(engine)
+    run_migrations(engine)
+    
+    with engine.connect() as connection:
+        assert schema_differences(connection) == []
+    assert {"ix_news_created_at_id", "ix_news_source_created_at_id"} <= _index_names(engine)
+
+
+def test_migrations_upgrade_schema_created_without_history(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    with engine.begin() as connection:
+        command.upgrade(get_alembic_config(connection), BASELINE_REVISION)
+        connection.execute(text("DROP TABLE alembic_version"))
+        connection.execute(text(
+            "INSERT INTO news (title, body, summary, source, url, published_at, created_at) "
+            "VALUES ('Title', 'Body', 'Summary', 'Source', 'http://www.example.com/a/?utm_source=x', "
+            "'2025-10-01 00:00:00', '2025-10-01 00:00:00')"
+        ))
+    
+    run_migrations(engine)
+    
+    assert {"ix_news_created_at_id", "ix_news_source_created_at_id"} <= _index_names(engine)
+    with engine.connect() as connection:
+        assert schema_differences(connection) == []
+        assert connection.execute(text("SELECT canonical_url FROM news")).scalar() == "https://example.com/a"
+        head = ScriptDirectory.from_config(get_alembic_config()).get_current_head()
+        assert connection.execute(text("SELECT version_num FROM alembic_version")).scalar() == head
+
+
+def test_near_duplicate_backfill_matches_signature_for(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'backfill.db'}")
+    url = "https://m.example.com/story/?b=2&utm_campaign=x&a=1"
+    title = "Open models close the gap"
+    body = "Open weight language models now match closed ones on most public benchmarks"
+    with engine.begin() as connection:
+        command.upgrade(get_alembic_config(connection), "0002")
+        connection.execute(text(
+            "INSERT INTO news (title, body, summary, source, url, published_at, created_at) "
+            "VALUES (:title, :body, 'Summary', 'Source', :url, '2025-10-01 00:00:00', '2025-10-01 00:00:00')"
+        ), {"title": title, "body": body, "url": url})
+        command.upgrade(get_alembic_config(connection), "0003")
+    
+    expected = signature_for(url, title, body).columns()
+    with engine.connect() as connection:
+        row = connection.execute(text(f"SELECT {', '.join(expected)} FROM news")).mappings().one()
+    assert expected["simhash"] is not None
+    assert dict(row) == expected
+
+
+def test_term_stats_backfill_matches_term_counts(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'term_stats.db'}")
+    title = "LLM agents and RAG"
+    body = "An agent calls an LLM through a GPT-4 style API; the llm answers"
+    with engine.begin() as connection:
+        command.upgrade(get_alembic_config(connection), "0004")
+        connection.execute(text(
+            "INSERT INTO news (title, body, summary, source, url, published_at, created_at) "
+            "VALUES (:title, :body, 'Summary', 'Source', 'https://example.com/a', "
+            "'2025-10-01 00:00:00', '2025-10-01 12:00:00')"
+        ), {"title": title, "body": body})
+        command.upgrade(get_alembic_config(connection), "0005")
+    
+    expected = {
+        (str(day), source, term): count
+        for (day, source, term), count in term_counts([(date(2025, 10, 1), "Source", title, body)]).items()
+    }
+    with engine.connect() as connection:
+        rows = connection.execute(text("SELECT day, source, term, count FROM news_term_stats")).all()
+    assert expected
+    assert {(str(row.day), row.source, row.term): row.count for row in rows} == expected
+
+
+def _query_plan(db_session, query) -> str:
+    compiled = query.statement.compile(dialect=sqlite.dialect(), compile_kwargs={"literal_binds": True})
+    rows = db_session.execute(text(f"EXPLAIN QUERY PLAN {compiled}")).all()
+    return " ".join(row[-1] for row in rows)
+
+
+def test_list_queries_use_indexes(db_session):
+    newest_first = (News.created_at.desc(), News.id.desc())
+    
+    plan = _query_plan(db_session, db_session.query(News).order_by(*newest_first).limit(10))
+    assert "ix_news_created_at_id" in plan
+    assert "TEMP B-TREE" not in plan
+    
+    by_source = db_session.query(News).filter(News.source == "Source").order_by(*newest_first).limit(10)
+    plan = _query_plan(db_session, by_source)
+    assert "ix_news_source_created_at_id" in plan
+    assert "TEMP B-TREE" not in plan
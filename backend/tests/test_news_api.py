@@ -1,5 +1,13 @@
+import asyncio
+import time
 from datetime import datetime
+from typing import List
+from pydantic import TypeAdapter
+from app.api.serialization import dump_news_row, dump_news_rows, select_news_rows
+from app.core.cache import news_cache
 from app.models.news import News
+from app.schemas.news import NewsCompactResponse, NewsResponse
+from app.services import jobs
 
 
 def test_health_check(client):
@@ -93,3 +101,263 @@ def test_get_news_pagination(client, db_session):
     data = response.json()
     assert len(data) == 5
 
+
+
+def test_get_news_cursor_pagination(client, db_session):
+    created_at = datetime(2025, 10, 17, 12, 0, 0)
+    for i in range(7):
+        db_session.add(News(
+            title=f"News {i}",
+            body="Body",
+            summary="Summary",
+            source="Source",
+            url=f"https://test.com/cursor{i}",
+            published_at=created_at,
+            created_at=created_at if i < 4 else datetime(2025, 10, 18)
+        ))
+    db_session.commit()
+    
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 3}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get("/api/news", params=params)
+        assert response.status_code == 200
+        seen.extend(item["id"] for item in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+    
+    assert len(seen) == 7
+    assert len(set(seen)) == 7
+    assert seen[:3] == sorted(seen[:3], reverse=True)
+
+
+def test_get_news_invalid_cursor(client):
+    response = client.get("/api/news?cursor=not-a-cursor")
+    assert response.status_code == 400
+
+
+def test_get_news_conditional_requests(client, db_session):
+    def add_news(i):
+        db_session.add(News(
+            title=f"News {i}",
+            body="Body",
+            summary="Summary",
+            source="Source",
+            url=f"https://test.com/etag{i}",
+            published_at=datetime(2025, 10, 17, 12, 0, 0),
+            created_at=datetime(2025, 10, 17, 12, i, 0)
+        ))
+        db_session.commit()
+    
+    add_news(0)
+    response = client.get("/api/news")
+    etag = response.headers["ETag"]
+    assert "Last-Modified" not in response.headers
+    
+    response = client.get("/api/news", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+    
+    response = client.get("/api/news", headers={"If-Modified-Since": "Fri, 17 Oct 2025 12:00:00 GMT"})
+    assert response.status_code == 200
+    
+    response = client.get("/api/news?limit=5", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    
+    item_id = response.json()[0]["id"]
+    item_etag = client.get(f"/api/news/{item_id}").headers["ETag"]
+    assert client.get(f"/api/news/{item_id}", headers={"If-None-Match": item_etag}).status_code == 304
+    assert client.get("/api/news/999999", headers={"If-None-Match": "*"}).status_code == 404
+    assert client.get("/api/news?cursor=not-a-cursor", headers={"If-None-Match": "*"}).status_code == 400
+    assert client.get("/api/news/search?q=x&cursor=not-a-cursor", headers={"If-None-Match": "*"}).status_code == 400
+    
+    add_news(1)
+    news_cache.clear()
+    
+    response = client.get("/api/news", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert len(response.json()) == 2
+
+
+def test_fast_serialization_matches_news_response(db_session):
+    db_session.add(News(
+        title="Ünïcode \"quoted\" title",
+        body="Body\nwith newline",
+        summary="Summary",
+        source="Source",
+        url="https://test.com/serialization",
+        published_at=datetime(2025, 10, 17, 12, 0, 0, 123456),
+        created_at=datetime(2025, 10, 17, 12, 30, 0),
+        score=10,
+        from_serper=True
+    ))
+    db_session.commit()
+    
+    rows = db_session.execute(select_news_rows()).all()
+    adapter = TypeAdapter(List[NewsResponse])
+    expected = adapter.dump_json(adapter.validate_python(db_session.query(News).all(), from_attributes=True))
+    
+    assert dump_news_rows(rows) == expected
+    assert dump_news_row(rows[0]) == NewsResponse.model_validate(rows[0]._asdict()).model_dump_json().encode()
+
+
+def test_get_news_compact_view(client, db_session):
+    db_session.add(News(
+        title="Compact News",
+        body="A long body that compact views leave out",
+        summary="Summary",
+        source="Source",
+        url="https://test.com/compact",
+        published_at=datetime.utcnow(),
+        created_at=datetime.utcnow(),
+        image_url="https://test.com/compact.jpg"
+    ))
+    db_session.commit()
+    
+    response = client.get("/api/news?view=compact")
+    assert response.status_code == 200
+    data = response.json()
+    assert set(data[0]) == set(NewsCompactResponse.model_fields)
+    assert "body" not in data[0]
+    assert data[0]["title"] == "Compact News"
+    
+    full = client.get("/api/news")
+    assert "body" in full.json()[0]
+    assert full.headers["ETag"] != response.headers["ETag"]
+    
+    assert client.get("/api/news?view=tiny").status_code == 422
+
+
+def _wait_for_job(client, job_id):
+    for _ in range(100):
+        job = client.get(f"/api/fetch-news/{job_id}").json()
+        if job["status"] not in ("queued", "running"):
+            return job
+        time.sleep(0.02)
+    raise AssertionError(f"Fetch job {job_id} did not finish")
+
+
+def test_fetch_news_runs_as_single_flight_job(client, monkeypatch):
+    calls = []
+    
+    async def fake_fetch_and_save_news(db, queries=None, use_cache=True, providers=None):
+        calls.append(db)
+        await asyncio.sleep(0.2)
+        return 3, 1
+    
+    monkeypatch.setattr(jobs, "fetch_and_save_news", fake_fetch_and_save_news)
+    monkeypatch.setattr(jobs, "export_news_snapshot", lambda: None)
+    
+    first = client.post("/api/fetch-news")
+    second = client.post("/api/fetch-news")
+    
+    assert first.status_code == 202
+    assert first.headers["Location"] == f"/api/fetch-news/{first.json()['job_id']}"
+    assert second.json()["job_id"] == first.json()["job_id"]
+    
+    job = _wait_for_job(client, first.json()["job_id"])
+    assert job["status"] == "succeeded"
+    assert (job["saved"], job["duplicates"]) == (3, 1)
+    assert set(job["timings"]) == {"ingest", "export", "total"}
+    assert job["queries"] == {"ingest": 0, "export": 0}
+    assert len(calls) == 1
+    
+    third = client.post("/api/fetch-news")
+    assert third.json()["job_id"] != first.json()["job_id"]
+    _wait_for_job(client, third.json()["job_id"])
+
+
+def test_fetch_news_job_failure(client, monkeypatch):
+    async def failing_fetch_and_save_news(db, queries=None, use_cache=True, providers=None):
+        raise RuntimeError("Serper unavailable")
+    
+    monkeypatch.setattr(jobs, "fetch_and_save_news", failing_fetch_and_save_news)
+    
+    job_id = client.post("/api/fetch-news").json()["job_id"]
+    job = _wait_for_job(client, job_id)
+    
+    assert job["status"] == "failed"
+    assert job["error"] == "Serper unavailable"
+
+
+def test_fetch_news_job_not_found(client):
+    response = client.get("/api/fetch-news/unknown")
+    assert response.status_code == 404
+
+
+def _add_search_fixtures(db_session):
+    created_at = datetime(2025, 10, 17, 12, 0, 0)
+    rows = [
+        ("Transformers explained", "A guide to attention", "Attention layers in depth", 0),
+        ("Weekly roundup", "Transformers and diffusion models", "Other news", 1),
+        ("Robotics update", "Robots learn to walk", "The body mentions transformers once", 2),
+        ("Gardening", "Tomatoes", "Nothing relevant here", 3),
+        ("100% match_rate", "Percent signs", "Literal wildcard characters", 4),
+    ]
+    for title, summary, body, i in rows:
+        db_session.add(News(
+            title=title,
+            body=body,
+            summary=summary,
+            source="arxiv" if i == 2 else "Source",
+            url=f"https://test.com/search{i}",
+            published_at=created_at,
+            created_at=datetime(2025, 10, 17, 12, i)
+        ))
+    db_session.commit()
+
+
+def test_search_news_ranks_and_highlights(client, db_session):
+    _add_search_fixtures(db_session)
+    
+    response = client.get("/api/news/search", params={"q": "transformers"})
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert [item["title"] for item in data] == ["Transformers explained", "Weekly roundup", "Robotics update"]
+    assert data[0]["rank"] > data[1]["rank"] > data[2]["rank"]
+    assert data[1]["highlight"] == "<mark>Transformers</mark> and diffusion models"
+    assert "body" not in data[0]
+
+
+def test_search_news_filters_and_sorts_newest(client, db_session):
+    _add_search_fixtures(db_session)
+    
+    newest = client.get("/api/news/search", params={"q": "transformers", "sort": "newest"}).json()
+    assert [item["title"] for item in newest] == ["Robotics update", "Weekly roundup", "Transformers explained"]
+    
+    by_source = client.get("/api/news/search", params={"q": "transformers", "source": "arxiv"}).json()
+    assert [item["title"] for item in by_source] == ["Robotics update"]
+
+
+def test_search_news_cursor_pagination(client, db_session):
+    _add_search_fixtures(db_session)
+    
+    for sort in ("relevance", "newest"):
+        seen = []
+        cursor = None
+        while True:
+            params = {"q": "transformers", "limit": 2, "sort": sort}
+            if cursor:
+                params["cursor"] = cursor
+            response = client.get("/api/news/search", params=params)
+            seen.extend(item["id"] for item in response.json())
+            cursor = response.headers.get("X-Next-Cursor")
+            if not cursor:
+                break
+        assert len(seen) == len(set(seen)) == 3
+
+
+def test_search_news_escapes_wildcards_and_validates(client, db_session):
+    _add_search_fixtures(db_session)
+    
+    assert [item["title"] for item in client.get("/api/news/search?q=match_rate").json()] == ["100% match_rate"]
+    assert client.get("/api/news/search?q=%25").json() == []
+    assert client.get("/api/news/search?q=").status_code == 422
+    assert client.get("/api/news/search?q=x&cursor=bad").status_code == 400
@@ -1,6 +1,14 @@
+import asyncio
 from datetime import datetime
+import httpx
 import pytest
-from app.services.news_fetcher import NewsFetcher
+from sqlalchemy import func, select
+from app.core.config import settings
+from app.core.http import create_http_client
+from app.models.news import News, NewsDuplicate
+from app.schemas.news import NewsCreate
+from app.services.news_fetcher import NewsFetcher, save_news_items
+from tests.fake_serper import FakeSerperServer
 
 
 def test_news_fetcher_initialization():
@@ -28,6 +36,15 @@ def test_parse_date_invalid():
     assert isinstance(result, datetime)
 
 
+def test_news_create_stores_naive_utc():
+    item = NewsCreate(
+        title="T", body="B", summary="S", source="Source", url="https://example.com/tz",
+        published_at=datetime.fromisoformat("2025-10-17T14:00:00+02:00")
+    )
+    assert item.published_at == datetime(2025, 10, 17, 12, 0, 0)
+    assert item.published_at.tzinfo is None
+
+
 def test_parse_serper_response():
     fetcher = NewsFetcher("test_key")
     mock_data = {
@@ -57,3 +74,148 @@ def test_parse_serper_response_empty():
     results = fetcher._parse_serper_response(mock_data, 1)
     assert len(results) == 0
 
+
+
+def _make_item(query: str, position: int) -> NewsCreate:
+    return NewsCreate(
+        title=query,
+        body="Body",
+        summary="Summary",
+        source="Source",
+        url=f"https://example.com/{position}",
+        published_at=datetime.now(),
+        search_position=position,
+        from_serper=True
+    )
+
+
+@pytest.mark.asyncio
+async def test_fetch_news_runs_queries_concurrently(monkeypatch):
+    fetcher = NewsFetcher("test_key")
+    fetcher.concurrency = 2
+    in_flight = 0
+    max_in_flight = 0
+    
+    async def fake_search(client, query, position):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return [_make_item(query, position)]
+    
+    monkeypatch.setattr(fetcher, "_search_query", fake_search)
+    results = await fetcher.fetch_news()
+    
+    assert len(results) == 5
+    assert max_in_flight == 2
+    assert [item.search_position for item in results] == [1, 2, 3, 4, 5]
+
+
+@pytest.mark.asyncio
+async def test_fetch_news_keeps_partial_results(monkeypatch):
+    fetcher = NewsFetcher("test_key")
+    fetcher.deadline = 0.2
+    
+    async def fake_search(client, query, position):
+        if position == 2:
+            raise httpx.HTTPError("boom")
+        if position == 3:
+            await asyncio.sleep(5)
+        return [_make_item(query, position)]
+    
+    monkeypatch.setattr(fetcher, "_search_query", fake_search)
+    results = await fetcher.fetch_news()
+    
+    assert [item.search_position for item in results] == [1, 4, 5]
+
+
+@pytest.mark.asyncio
+async def test_save_news_items_deduplicates_in_batch_and_against_table(async_db_session, monkeypatch):
+    monkeypatch.setattr(settings, "ingest_chunk_size", 2)
+    await save_news_items(async_db_session, [_make_item("Existing", 1)])
+    
+    batch = [
+        _make_item("Existing again", 1),
+        _make_item("New", 2),
+        _make_item("New repeated", 2),
+        _make_item("Another", 3),
+        _make_item("Last", 4),
+    ]
+    saved, duplicates = await save_news_items(async_db_session, batch)
+    
+    assert (saved, duplicates) == (3, 2)
+    assert await async_db_session.scalar(select(func.count(News.id))) == 4
+    title = await async_db_session.scalar(select(News.title).where(News.url == "https://example.com/2"))
+    assert title == "New"
+
+
+@pytest.mark.asyncio
+async def test_save_news_items_empty(async_db_session):
+    assert await save_news_items(async_db_session, []) == (0, 0)
+
+
+@pytest.mark.asyncio
+async def test_shared_client_reuses_connections_across_runs(monkeypatch):
+    monkeypatch.setattr(settings, "http2_enabled", False)
+    
+    with FakeSerperServer() as server:
+        client = create_http_client()
+        try:
+            fetcher = NewsFetcher("test_key", client)
+            fetcher.base_url = server.url
+            first = await fetcher.fetch_news()
+            connections_after_first_run = server.connections
+            
+            fetcher = NewsFetcher("test_key", client)
+            fetcher.base_url = server.url
+            fetcher.concurrency = 1
+            second = await fetcher.fetch_news()
+        finally:
+            await client.aclose()
+    
+    assert len(first) == len(second) == 50
+    assert len(server.requests) == 10
+    assert 1 <= connections_after_first_run <= fetcher.max_searches
+    assert server.connections == connections_after_first_run
+
+
+@pytest.mark.asyncio
+async def test_fetcher_without_shared_client_opens_its_own(monkeypatch):
+    monkeypatch.setattr(settings, "http2_enabled", False)
+    
+    with FakeSerperServer() as server:
+        fetcher = NewsFetcher("test_key")
+        fetcher.base_url = server.url
+        await fetcher.fetch_news(["machine learning"])
+        await fetcher.fetch_news(["machine learning"])
+    
+    assert server.connections == 2
+
+
+@pytest.mark.asyncio
+async def test_save_news_items_records_near_duplicates(async_db_session):
+    story = "OpenAI releases a new reasoning model that beats previous benchmarks on math and coding tasks"
+    
+    def item(url, title, body=story):
+        return NewsCreate(
+            title=title, body=body, summary=body[:200], source="Source", url=url, published_at=datetime.now()
+        )
+    
+    assert await save_news_items(async_db_session, [item("https://example.com/story", "OpenAI model")]) == (1, 0)
+    
+    saved, duplicates = await save_news_items(async_db_session, [
+        item("https://example.com/story?utm_source=feed", "Tracking copy"),
+        item("https://mirror.example.org/openai", "OpenAI model", story + " today"),
+        item("https://example.com/other", "Other", "Google unveils a protein folding system for every known molecule"),
+    ])
+    
+    assert (saved, duplicates) == (1, 2)
+    original_id = await async_db_session.scalar(select(News.id).where(News.url == "https://example.com/story"))
+    clusters = (await async_db_session.execute(
+        select(NewsDuplicate.url, NewsDuplicate.news_id).order_by(NewsDuplicate.url)
+    )).tuples().all()
+    assert clusters == [
+        ("https://example.com/story?utm_source=feed", original_id),
+        ("https://mirror.example.org/openai", original_id),
+    ]
@@ -0,0 +1,99 @@
+import asyncio
+import cProfile
+import pstats
+import re
+from datetime import datetime
+
+from app.core.config import settings
+from app.core.profiling import ProfiledSteps, server_timing_header
+from app.models.news import News
+
+
+def _server_timing(response) -> dict:
+    return {
+        name: float(duration)
+        for name, duration in re.findall(r"(\w+);dur=([\d.]+)", response.headers["server-timing"])
+    }
+
+
+def _add_news(db_session, count):
+    for i in range(count):
+        db_session.add(News(
+            title=f"News {i}",
+            body="Body",
+            summary="Summary",
+            source="Source",
+            url=f"https://test.com/profiled{i}",
+            published_at=datetime(2025, 10, 17, 12, 0, 0)
+        ))
+    db_session.commit()
+
+
+def test_server_timing_header_lists_every_stage():
+    assert server_timing_header({"db": 0.0125}, 0.02) == "db;dur=12.5, serialize;dur=0.0, total;dur=20.0"
+
+
+def test_profiling_is_off_by_default(client):
+    response = client.get("/api/news", headers={"X-Profile": "1"})
+    
+    assert response.status_code == 200
+    assert "server-timing" not in response.headers
+
+
+def test_profiling_header_mode_adds_server_timing(client, db_session, monkeypatch):
+    monkeypatch.setattr(settings, "profiling_mode", "header")
+    monkeypatch.setattr(settings, "profiling_slow_threshold_ms", 60_000)
+    _add_news(db_session, 20)
+    
+    assert "server-timing" not in client.get("/api/news").headers
+    
+    response = client.get("/api/news?limit=1000", headers={"X-Profile": "1"})
+    
+    assert len(response.json()) == 20
+    timings = _server_timing(response)
+    assert set(timings) == {"db", "serialize", "total"}
+    assert timings["db"] > 0
+    assert timings["serialize"] > 0
+    assert timings["total"] >= timings["db"] + timings["serialize"]
+
+
+def test_slow_requests_dump_profiles(client, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "profiling_mode", "always")
+    monkeypatch.setattr(settings, "profiling_slow_threshold_ms", 0)
+    monkeypatch.setattr(settings, "profiling_dump_dir", str(tmp_path))
+    
+    response = client.get("/api/news")
+    
+    assert "server-timing" in response.headers
+    [profile] = tmp_path.glob("*-get-api-news-*ms.prof")
+    stats = pstats.Stats(str(profile))
+    assert any(function == "get_news" for _, _, function in stats.stats)
+
+
+def test_profiled_steps_leave_out_other_tasks():
+    profiler = cProfile.Profile()
+    
+    def busy_neighbour():
+        return sum(range(1000))
+    
+    async def neighbour():
+        for _ in range(5):
+            busy_neighbour()
+            await asyncio.sleep(0)
+    
+    def busy_request():
+        return sum(range(1000))
+    
+    async def request():
+        for _ in range(5):
+            busy_request()
+            await asyncio.sleep(0)
+    
+    async def main():
+        await asyncio.gather(neighbour(), ProfiledSteps(request(), profiler))
+    
+    asyncio.run(main())
+    
+    functions = {function for _, _, function in pstats.Stats(profiler).stats}
+    assert "busy_request" in functions
+    assert "busy_neighbour" not in functions
@@ -0,0 +1,169 @@
+import asyncio
+import httpx
+import pytest
+from app.core.config import settings
+from app.services.providers.arxiv import ArxivProvider
+from app.services.providers.base import SourceProvider
+from app.services.providers.collector import build_providers, collect_news
+from app.services.providers.hackernews import HackerNewsProvider
+from app.services.providers.rss import RSSProvider
+from app.services.providers.serper import SerperProvider
+
+RSS_FEED = b"""<?xml version="1.0"?>
+<rss version="2.0">
+  <channel>
+    <title>AI Weekly</title>
+    <item>
+      <title>New &lt;b&gt;LLM&lt;/b&gt; released</title>
+      <link>https://example.com/llm</link>
+      <description>&lt;p&gt;A new model is &lt;em&gt;out&lt;/em&gt;.&lt;/p&gt;</description>
+      <pubDate>Mon, 06 Oct 2025 10:00:00 GMT</pubDate>
+    </item>
+    <item>
+      <title>No link here</title>
+    </item>
+  </channel>
+</rss>"""
+
+ARXIV_FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>arXiv Query</title>
+  <entry>
+    <id>http://arxiv.org/abs/2510.12796v1</id>
+    <published>2025-10-14T17:59:59Z</published>
+    <title>Scaling
+      Laws for Agents</title>
+    <summary>We study scaling laws.</summary>
+    <link href="http://arxiv.org/abs/2510.12796v1" rel="alternate" type="text/html"/>
+    <link title="pdf" href="http://arxiv.org/pdf/2510.12796v1" rel="related" type="application/pdf"/>
+  </entry>
+</feed>"""
+
+HN_ITEMS = {
+    1: {"id": 1, "type": "story", "title": "Show HN: An LLM agent", "url": "https://example.com/agent",
+        "time": 1760000000, "score": 120, "descendants": 45},
+    2: {"id": 2, "type": "story", "title": "Gardening tips", "url": "https://example.com/garden", "time": 1760000000},
+    3: {"id": 3, "type": "story", "title": "Ask HN: AI in production?", "text": "<p>How do you deploy?</p>",
+        "time": 1760000000, "score": 10, "descendants": 3},
+    4: {"id": 4, "type": "comment", "text": "AI comment", "time": 1760000000},
+}
+
+
+def hn_handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path.endswith("/topstories.json"):
+        return httpx.Response(200, json=[1, 2, 3, 4, 5])
+    item_id = int(request.url.path.rsplit("/", 1)[-1].removesuffix(".json"))
+    if item_id not in HN_ITEMS:
+        return httpx.Response(500)
+    return httpx.Response(200, json=HN_ITEMS[item_id])
+
+
+def test_rss_provider_parses_rss_items():
+    items = RSSProvider(feed_urls=[]).parse_feed(RSS_FEED, "https://example.com/feed.xml")
+    
+    assert len(items) == 1
+    assert items[0].title == "New LLM released"
+    assert items[0].body == "A new model is out ."
+    assert items[0].source == "AI Weekly"
+    assert items[0].published_at.isoformat() == "2025-10-06T10:00:00"
+
+
+def test_arxiv_provider_parses_atom_entries():
+    items = ArxivProvider().parse_feed(ARXIV_FEED)
+    
+    assert len(items) == 1
+    assert items[0].title == "Scaling Laws for Agents"
+    assert items[0].url == "http://arxiv.org/abs/2510.12796v1"
+    assert items[0].source == "arxiv"
+    assert items[0].priority == 3
+
+
+@pytest.mark.asyncio
+async def test_arxiv_provider_builds_category_query(monkeypatch):
+    monkeypatch.setattr(settings, "arxiv_categories", ["cs.AI", "cs.LG"])
+    requests = []
+    
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, content=ARXIV_FEED)
+    
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        items = await ArxivProvider().fetch(client)
+    
+    assert len(items) == 1
+    assert requests[0].url.params["search_query"] == "cat:cs.AI OR cat:cs.LG"
+
+
+@pytest.mark.asyncio
+async def test_hackernews_provider_filters_and_maps_stories(monkeypatch):
+    monkeypatch.setattr(settings, "hackernews_keywords", ["llm", "ai"])
+    
+    async with httpx.AsyncClient(transport=httpx.MockTransport(hn_handler)) as client:
+        items = await HackerNewsProvider().fetch(client)
+    
+    assert [item.hn_id for item in items] == [1, 3]
+    assert items[0].score == 120
+    assert items[0].comments_count == 45
+    assert items[0].source == "hackernews"
+    assert items[1].url == "https://news.ycombinator.com/item?id=3"
+    assert items[1].body == "How do you deploy?"
+
+
+@pytest.mark.asyncio
+async def test_rss_provider_skips_failing_feeds():
+    def handler(request):
+        if request.url.host == "broken.example.com":
+            return httpx.Response(503)
+        return httpx.Response(200, content=RSS_FEED)
+    
+    provider = RSSProvider(["https://example.com/feed.xml", "https://broken.example.com/feed.xml"])
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        items = await provider.fetch(client)
+    
+    assert [item.url for item in items] == ["https://example.com/llm"]
+
+
+class SlowProvider(SourceProvider):
+    name = "slow"
+    
+    async def fetch(self, client):
+        await asyncio.sleep(5)
+        return []
+
+
+class BrokenProvider(SourceProvider):
+    name = "broken"
+    
+    async def fetch(self, client):
+        raise RuntimeError("boom")
+
+
+def test_provider_without_fetch_cannot_be_constructed():
+    class IncompleteProvider(SourceProvider):
+        name = "incomplete"
+    
+    with pytest.raises(TypeError, match="fetch"):
+        IncompleteProvider()
+
+
+@pytest.mark.asyncio
+async def test_collect_news_isolates_slow_and_failing_providers():
+    feed = RSSProvider(["https://example.com/feed.xml"])
+    providers = [SlowProvider(timeout=0.1), BrokenProvider(), feed]
+    
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=RSS_FEED))
+    async with httpx.AsyncClient(transport=transport) as client:
+        collected = await asyncio.wait_for(collect_news(providers, client), timeout=2)
+    
+    assert collected["slow"] == []
+    assert collected["broken"] == []
+    assert len(collected["rss"]) == 1
+
+
+def test_build_providers_follows_settings(monkeypatch):
+    monkeypatch.setattr(settings, "news_providers", ["serper", "arxiv", "unknown"])
+    
+    providers = build_providers(["only this"])
+    
+    assert [type(provider) for provider in providers] == [SerperProvider, ArxivProvider]
+    assert providers[0].queries == ["only this"]
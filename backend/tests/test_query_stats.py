@@ -0,0 +1,83 @@
+import logging
+from datetime import datetime
+
+import pytest
+from sqlalchemy import select, text
+
+from app.core.config import settings
+from app.core.query_stats import redact_parameters, track_queries
+from app.models.news import News
+from app.schemas.news import NewsCreate
+from app.services.news_fetcher import save_news_items
+from tests.conftest import TestingAsyncSessionLocal
+
+
+def _items(count, prefix):
+    return [
+        NewsCreate(
+            title=f"{prefix} story {i}",
+            body=f"Body {i}",
+            summary="Summary",
+            source="Source",
+            url=f"https://test.com/{prefix}/{i}",
+            published_at=datetime(2025, 10, 17, 12, 0, 0)
+        )
+        for i in range(count)
+    ]
+
+
+def test_redact_parameters():
+    assert redact_parameters((), False) == "no parameters"
+    assert redact_parameters(("secret", 1), False) == "2 parameters redacted"
+    assert redact_parameters([("a", 1), ("b", 2), ("c", 3)], True) == "3 parameter sets of 2 values redacted"
+
+
+def test_news_endpoints_stay_within_statement_budget(client, db_session, assert_max_queries):
+    db_session.add_all([News(**item.model_dump()) for item in _items(30, "budget")])
+    db_session.commit()
+    news_id = db_session.scalar(select(News.id).limit(1))
+    
+    with assert_max_queries(2):
+        response = client.get("/api/news?limit=1000")
+    assert len(response.json()) == 30
+    assert response.headers["x-query-count"] == "2"
+    
+    with assert_max_queries(1):
+        assert client.get(f"/api/news/{news_id}").status_code == 200
+    
+    with assert_max_queries(0):
+        assert client.get("/api/news?limit=1000").headers["x-query-count"] == "0"
+
+
+def test_assert_max_queries_reports_statements(client, assert_max_queries):
+    with pytest.raises(AssertionError, match="at most 0 SQL statements, got 2"):
+        with assert_max_queries(0):
+            client.get("/api/news")
+
+
+@pytest.mark.asyncio
+async def test_save_news_items_statement_count_does_not_grow_with_batch(db_session):
+    async def statements_for(items):
+        async with TestingAsyncSessionLocal() as db:
+            with track_queries("test") as stats:
+                await save_news_items(db, items)
+        return stats.count
+    
+    small = await statements_for(_items(5, "small"))
+    large = await statements_for(_items(200, "large"))
+    
+    assert small == large
+
+
+@pytest.mark.asyncio
+async def test_slow_queries_are_logged_without_parameters(db_session, monkeypatch, caplog):
+    monkeypatch.setattr(settings, "slow_query_threshold_ms", 0.000001)
+    
+    with caplog.at_level(logging.WARNING, logger="app.core.query_stats"):
+        async with TestingAsyncSessionLocal() as db:
+            await db.execute(text("SELECT :secret"), {"secret": "hunter2"})
+    
+    [message] = [record.getMessage() for record in caplog.records if "SELECT" in record.getMessage()]
+    assert "Slow query" in message
+    assert "1 parameters redacted" in message
+    assert "hunter2" not in message
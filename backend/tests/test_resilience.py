@@ -0,0 +1,182 @@
+import asyncio
+import time
+from datetime import datetime, timedelta, UTC
+from email.utils import format_datetime
+
+import httpx
+import pytest
+
+from app.core.config import settings
+from app.core.http import create_http_client
+from app.services.news_fetcher import NewsFetcher
+from app.services.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    TokenBucket,
+    backoff_delay,
+    parse_retry_after,
+)
+from tests.fake_serper import FakeSerperServer, organic_results
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_throttles_after_burst():
+    bucket = TokenBucket(rate=20, capacity=2)
+    
+    start = time.monotonic()
+    for _ in range(4):
+        await bucket.acquire()
+    elapsed = time.monotonic() - start
+    
+    assert 0.09 <= elapsed < 0.5
+
+
+def test_circuit_breaker_opens_and_recovers(monkeypatch):
+    now = 100.0
+    monkeypatch.setattr("app.services.resilience.time.monotonic", lambda: now)
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10)
+    
+    breaker.before_call()
+    breaker.record_failure()
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    
+    now += 10
+    assert breaker.state == "half_open"
+    breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == "open"
+    
+    now += 10
+    breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == "closed"
+
+
+def test_parse_retry_after():
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("garbage") is None
+    
+    retry_at = format_datetime(datetime.now(UTC) + timedelta(seconds=30), usegmt=True)
+    assert 25 <= parse_retry_after(retry_at) <= 30
+
+
+def test_backoff_delay_is_capped():
+    assert backoff_delay(0, 1.0, 30.0, retry_after=120) == 30.0
+    for attempt in range(10):
+        assert 0 <= backoff_delay(attempt, 1.0, 4.0) <= 4.0
+
+
+def _fetcher(server, client, breaker=None):
+    fetcher = NewsFetcher(
+        "test_key",
+        client,
+        rate_limiter=TokenBucket(rate=0, capacity=1),
+        circuit_breaker=breaker or CircuitBreaker(failure_threshold=3, reset_timeout=60)
+    )
+    fetcher.base_url = server.url
+    fetcher.retry_base_delay = 0.01
+    return fetcher
+
+
+@pytest.mark.asyncio
+async def test_search_retries_and_honors_retry_after(monkeypatch):
+    monkeypatch.setattr(settings, "http2_enabled", False)
+    statuses = [(429, {"Retry-After": "0.05"}), (503, {})]
+    
+    with FakeSerperServer() as server:
+        def respond(payload):
+            if statuses:
+                status, headers = statuses.pop(0)
+                return status, headers, {"message": "try later"}
+            return 200, {}, organic_results(payload["q"], 2)
+        
+        server.respond = respond
+        async with create_http_client() as client:
+            start = time.monotonic()
+            results = await _fetcher(server, client)._search_query(client, "LLM", 1)
+            elapsed = time.monotonic() - start
+    
+    assert len(results) == 2
+    assert len(server.requests) == 3
+    assert elapsed >= 0.05
+
+
+@pytest.mark.asyncio
+async def test_search_does_not_retry_client_errors(monkeypatch):
+    monkeypatch.setattr(settings, "http2_enabled", False)
+    
+    with FakeSerperServer() as server:
+        server.respond = lambda payload: (403, {}, {"message": "bad key"})
+        async with create_http_client() as client:
+            with pytest.raises(httpx.HTTPStatusError):
+                await _fetcher(server, client)._search_query(client, "LLM", 1)
+    
+    assert len(server.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_fails_fast_when_upstream_is_down(monkeypatch):
+    monkeypatch.setattr(settings, "http2_enabled", False)
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+    
+    with FakeSerperServer() as server:
+        server.respond = lambda payload: (503, {}, {"message": "down"})
+        async with create_http_client() as client:
+            fetcher = _fetcher(server, client, breaker)
+            fetcher.max_retries = 5
+            with pytest.raises(CircuitOpenError):
+                await fetcher._search_query(client, "LLM", 1)
+            
+            results = await _fetcher(server, client, breaker).fetch_news()
+    
+    assert results == []
+    assert len(server.requests) == 3
+    assert breaker.state == "open"
+
+
+@pytest.mark.asyncio
+async def test_search_recovers_from_injected_latency_and_errors(monkeypatch):
+    monkeypatch.setattr(settings, "http2_enabled", False)
+    
+    with FakeSerperServer(latency=0.02, error_rate=0.5, seed=10) as server:
+        async with create_http_client() as client:
+            fetcher = _fetcher(server, client)
+            start = time.monotonic()
+            results = await fetcher._search_query(client, "LLM", 1)
+            elapsed = time.monotonic() - start
+    
+    assert len(results) == 10
+    assert len(server.requests) == 3
+    assert elapsed >= 0.02 * len(server.requests)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_half_open_trial_releases_the_breaker(monkeypatch):
+    monkeypatch.setattr(settings, "http2_enabled", False)
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    breaker.before_call()
+    breaker.record_failure()
+    await asyncio.sleep(0.06)
+    assert breaker.state == "half_open"
+    
+    with FakeSerperServer(latency=0.5) as server:
+        async with create_http_client() as client:
+            trial = asyncio.create_task(_fetcher(server, client, breaker)._search_query(client, "LLM", 1))
+            await asyncio.sleep(0.1)
+            trial.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await trial
+            
+            assert breaker.state == "half_open"
+            server.latency = 0
+            results = await _fetcher(server, client, breaker)._search_query(client, "LLM", 1)
+    
+    assert len(results) == 10
+    assert breaker.state == "closed"
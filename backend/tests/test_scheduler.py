@@ -0,0 +1,215 @@
+import asyncio
+import gzip
+import json
+import stat
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.core.config import settings
+from app.models.news import News
+from app.services import jobs
+from app.services import scheduler as scheduler_module
+from app.services import snapshot_files
+from app.services.scheduler import export_news_to_json, scheduled_news_fetch, shutdown_scheduler, start_scheduler
+
+
+def _add_news(db_session, count, start=0):
+    base = datetime(2025, 10, 17, 12, 0, 0)
+    for i in range(start, start + count):
+        db_session.add(News(
+            title=f"News {i}",
+            body="Body with a \"quote\"\nand a newline",
+            summary="Summary",
+            source="Source",
+            url=f"https://test.com/export{i}",
+            published_at=base,
+            created_at=base + timedelta(minutes=i)
+        ))
+    db_session.commit()
+
+
+def test_export_news_to_json_full(db_session, tmp_path, monkeypatch):
+    json_path = tmp_path / "news.json"
+    monkeypatch.setattr(settings, "frontend_json_path", str(json_path))
+    monkeypatch.setattr(settings, "export_chunk_size", 2)
+    _add_news(db_session, 5)
+    
+    export_news_to_json(db_session)
+    
+    data = json.loads(json_path.read_text())
+    assert [item["title"] for item in data] == [f"News {i}" for i in range(4, -1, -1)]
+    assert data[0]["created_at"] == "2025-10-17T12:04:00"
+    assert data[0]["body"] == "Body with a \"quote\"\nand a newline"
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+def test_export_news_to_json_empty(db_session, tmp_path, monkeypatch):
+    json_path = tmp_path / "news.json"
+    monkeypatch.setattr(settings, "frontend_json_path", str(json_path))
+    
+    export_news_to_json(db_session, incremental=True)
+    
+    assert json.loads(json_path.read_text()) == []
+
+
+def test_export_news_to_json_incremental(db_session, tmp_path, monkeypatch):
+    json_path = tmp_path / "news.json"
+    monkeypatch.setattr(settings, "frontend_json_path", str(json_path))
+    _add_news(db_session, 3)
+    export_news_to_json(db_session, incremental=True)
+    
+    _add_news(db_session, 2, start=3)
+    db_session.query(News).filter(News.title == "News 0").update({"title": "Changed"})
+    db_session.commit()
+    export_news_to_json(db_session, incremental=True)
+    
+    data = json.loads(json_path.read_text())
+    assert [item["title"] for item in data] == ["News 4", "News 3", "News 2", "News 1", "News 0"]
+    
+    export_news_to_json(db_session)
+    
+    data = json.loads(json_path.read_text())
+    assert data[-1]["title"] == "Changed"
+
+
+def test_export_writes_compressed_ndjson_and_sharded_snapshots(db_session, tmp_path, monkeypatch):
+    json_path = tmp_path / "news.json"
+    monkeypatch.setattr(settings, "frontend_json_path", str(json_path))
+    monkeypatch.setattr(settings, "export_ndjson", True)
+    monkeypatch.setattr(settings, "export_shard_size", 2)
+    (tmp_path / "meta.json").write_text(json.dumps({"last_updated": "old", "note": "kept"}))
+    (tmp_path / "news").mkdir()
+    (tmp_path / "news" / "page-0009.json").write_text("[]")
+    _add_news(db_session, 5)
+    
+    export_news_to_json(db_session)
+    
+    raw = json_path.read_bytes()
+    assert b'": ' not in raw
+    assert gzip.decompress((tmp_path / "news.json.gz").read_bytes()) == raw
+    ndjson = (tmp_path / "news.ndjson").read_text().splitlines()
+    assert [json.loads(line)["title"] for line in ndjson] == [f"News {i}" for i in range(4, -1, -1)]
+    
+    pages = sorted(path.name for path in (tmp_path / "news").glob("page-*.json"))
+    assert pages == ["page-0001.json", "page-0002.json", "page-0003.json"]
+    assert [item["title"] for item in json.loads((tmp_path / "news" / "page-0002.json").read_text())] == \
+        ["News 2", "News 1"]
+    assert (tmp_path / "news" / "page-0001.json.gz").exists()
+    
+    meta = json.loads((tmp_path / "meta.json").read_text())
+    assert meta["note"] == "kept"
+    assert meta["last_updated"] != "old"
+    assert meta["count"] == 5
+    assert meta["files"] == ["news.json", "news.json.gz", "news.ndjson", "news.ndjson.gz"]
+    assert [shard["count"] for shard in meta["shards"]] == [2, 2, 1]
+    assert meta["shards"][0]["file"] == "news/page-0001.json"
+
+
+def test_export_files_get_the_default_file_mode(db_session, tmp_path, monkeypatch):
+    json_path = tmp_path / "news.json"
+    monkeypatch.setattr(settings, "frontend_json_path", str(json_path))
+    _add_news(db_session, 3)
+    reference = tmp_path / "reference.txt"
+    reference.write_text("")
+    
+    export_news_to_json(db_session)
+    
+    expected = stat.S_IMODE(reference.stat().st_mode)
+    for path in [json_path, tmp_path / "news.json.gz", tmp_path / "meta.json", tmp_path / "news" / "page-0001.json"]:
+        assert stat.S_IMODE(path.stat().st_mode) == expected
+
+
+def test_export_shards_per_day(db_session, tmp_path, monkeypatch):
+    json_path = tmp_path / "news.json"
+    monkeypatch.setattr(settings, "frontend_json_path", str(json_path))
+    monkeypatch.setattr(settings, "export_shard_mode", "day")
+    monkeypatch.setattr(settings, "export_gzip", False)
+    monkeypatch.setattr(settings, "export_brotli", True)
+    monkeypatch.setattr(snapshot_files, "brotli", None)
+    _add_news(db_session, 2)
+    db_session.add(News(
+        title="Next day", body="Body", summary="Summary", source="Source", url="https://test.com/day",
+        published_at=datetime(2025, 10, 18), created_at=datetime(2025, 10, 18, 9)
+    ))
+    db_session.commit()
+    
+    export_news_to_json(db_session)
+    
+    meta = json.loads((tmp_path / "meta.json").read_text())
+    assert meta["files"] == ["news.json"]
+    assert [(shard["day"], shard["count"]) for shard in meta["shards"]] == [("2025-10-18", 1), ("2025-10-17", 2)]
+    assert json.loads((tmp_path / "news" / "day-2025-10-18.json").read_text())[0]["title"] == "Next day"
+    assert list(tmp_path.rglob("*.gz")) == list(tmp_path.rglob("*.br")) == []
+
+
+@pytest.mark.asyncio
+async def test_start_scheduler_registers_jobs_on_running_loop(monkeypatch):
+    monkeypatch.setattr(settings, "scheduler_hot_interval_minutes", 30)
+    
+    start_scheduler()
+    try:
+        jobs_by_id = {job.id: job for job in scheduler_module.scheduler.get_jobs()}
+        assert set(jobs_by_id) == {"daily_news_fetch", "hot_news_fetch"}
+        
+        hot = jobs_by_id["hot_news_fetch"]
+        assert hot.kwargs == {"trigger": "hot", "queries": settings.serper_hot_queries, "providers": ["serper"]}
+        assert hot.coalesce is True
+        assert hot.max_instances == 1
+        assert hot.trigger.jitter == settings.scheduler_jitter_seconds
+    finally:
+        shutdown_scheduler()
+        await asyncio.sleep(0)
+    
+    assert not scheduler_module.scheduler.running
+
+
+@pytest.mark.asyncio
+async def test_scheduled_fetch_waits_for_running_job(monkeypatch):
+    calls = []
+    
+    async def fake_fetch_and_save_news(db, queries=None, use_cache=True, providers=None):
+        calls.append(queries)
+        await asyncio.sleep(0.05)
+        return len(calls), 0
+    
+    monkeypatch.setattr(jobs, "fetch_and_save_news", fake_fetch_and_save_news)
+    monkeypatch.setattr(jobs, "export_news_snapshot", lambda: None)
+    monkeypatch.setattr(jobs, "fetch_jobs", jobs.FetchJobManager())
+    
+    manual, _ = jobs.fetch_jobs.submit("manual")
+    await scheduled_news_fetch("hot", ["LLM"])
+    
+    assert manual.status == "succeeded"
+    assert calls == [None, ["LLM"]]
+
+
+@pytest.mark.asyncio
+async def test_manual_fetch_during_hot_job_queues_a_full_fetch(monkeypatch):
+    calls = []
+    
+    async def fake_fetch_and_save_news(db, queries=None, use_cache=True, providers=None):
+        calls.append((queries, use_cache, providers))
+        await asyncio.sleep(0.05)
+        return len(calls), 0
+    
+    monkeypatch.setattr(jobs, "fetch_and_save_news", fake_fetch_and_save_news)
+    monkeypatch.setattr(jobs, "export_news_snapshot", lambda: None)
+    monkeypatch.setattr(jobs, "fetch_jobs", jobs.FetchJobManager())
+    
+    hot, _ = jobs.fetch_jobs.submit("hot", ["LLM"], ["serper"])
+    merged_hot, created = jobs.fetch_jobs.submit("hot", ["LLM"], ["serper"])
+    assert merged_hot is hot and not created
+    
+    manual, created = jobs.fetch_jobs.submit("manual")
+    assert created and manual.status == "queued"
+    merged_manual, created = jobs.fetch_jobs.submit("manual")
+    assert merged_manual is manual and not created
+    
+    await jobs.fetch_jobs.wait(manual)
+    
+    assert hot.status == "succeeded"
+    assert manual.status == "succeeded"
+    assert calls == [(["LLM"], False, ["serper"]), (None, True, None)]
+    assert jobs.fetch_jobs.submit("manual")[1]
+    await jobs.fetch_jobs.shutdown()
@@ -0,0 +1,123 @@
+import pytest
+
+from app.core.config import BACKEND_DIR, settings
+from app.core.http import create_http_client
+from app.services.news_fetcher import NewsFetcher
+from app.services.resilience import CircuitBreaker, TokenBucket
+from app.services.search_cache import SearchCache, get_search_cache
+from tests.fake_serper import FakeSerperServer, load_recordings, organic_results
+
+
+@pytest.fixture
+def search_cache(tmp_path):
+    cache = SearchCache(str(tmp_path / "serper.sqlite3"), ttl_seconds=3600, max_bytes=1_000_000)
+    yield cache
+    cache.close()
+
+
+def test_search_cache_round_trip(search_cache):
+    data = organic_results("LLM", 3)
+    assert search_cache.get("LLM", 10) is None
+    
+    search_cache.set("LLM", 10, data)
+    
+    assert search_cache.get("LLM", 10) == data
+    assert search_cache.get("llm ", 10) == data
+    assert search_cache.get("LLM", 5) is None
+
+
+def test_search_cache_expires_with_time_bucket(search_cache, monkeypatch):
+    now = 7200.0
+    monkeypatch.setattr("app.services.search_cache.time.time", lambda: now)
+    search_cache.set("LLM", 10, organic_results("LLM", 1))
+    
+    now += 3599
+    assert search_cache.get("LLM", 10) is not None
+    now += 1
+    assert search_cache.get("LLM", 10) is None
+    
+    search_cache.set("deep learning", 10, organic_results("deep learning", 1))
+    assert search_cache.get("LLM", 10) is None
+    assert search_cache.get("deep learning", 10) is not None
+
+
+def test_search_cache_evicts_least_recently_used(tmp_path, monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr("app.services.search_cache.time.time", lambda: now)
+    entry_size = len(b'{"organic": []}')
+    cache = SearchCache(str(tmp_path / "serper.sqlite3"), ttl_seconds=3600, max_bytes=2 * entry_size)
+    
+    for query in ("a", "b"):
+        now += 1
+        cache.set(query, 10, {"organic": []})
+    now += 1
+    cache.get("a", 10)
+    now += 1
+    cache.set("c", 10, {"organic": []})
+    
+    assert cache.get("a", 10) is not None
+    assert cache.get("b", 10) is None
+    assert cache.get("c", 10) is not None
+    assert cache.size_bytes() <= 2 * entry_size
+    cache.close()
+
+
+def test_relative_cache_path_is_anchored_to_backend_dir(monkeypatch):
+    monkeypatch.setattr(settings, "serper_cache_enabled", True)
+    monkeypatch.setattr(settings, "serper_cache_path", ".cache/serper.sqlite3")
+    monkeypatch.setattr("app.services.search_cache._search_cache", None)
+    
+    assert get_search_cache().path == BACKEND_DIR / ".cache" / "serper.sqlite3"
+
+
+@pytest.mark.asyncio
+async def test_fetcher_serves_repeated_queries_from_cache(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "http2_enabled", False)
+    monkeypatch.setattr(settings, "serper_cache_enabled", True)
+    monkeypatch.setattr(settings, "serper_cache_path", str(tmp_path / "serper.sqlite3"))
+    monkeypatch.setattr("app.services.search_cache._search_cache", None)
+    
+    def make_fetcher(server, client, use_cache=True):
+        fetcher = NewsFetcher(
+            "test_key",
+            client,
+            rate_limiter=TokenBucket(rate=0, capacity=1),
+            circuit_breaker=CircuitBreaker(failure_threshold=3, reset_timeout=60),
+            use_cache=use_cache
+        )
+        fetcher.base_url = server.url
+        return fetcher
+    
+    with FakeSerperServer() as server:
+        async with create_http_client() as client:
+            first = await make_fetcher(server, client).fetch_news(["LLM", "deep learning"])
+            second = await make_fetcher(server, client).fetch_news(["LLM", "deep learning"])
+            assert len(server.requests) == 2
+            
+            bypassed = await make_fetcher(server, client, use_cache=False).fetch_news(["LLM"])
+            assert len(server.requests) == 3
+    
+    assert [item.url for item in first] == [item.url for item in second]
+    assert len(bypassed) == 10
+
+
+@pytest.mark.asyncio
+async def test_fake_serper_replays_recordings_from_cache_database(search_cache, monkeypatch):
+    monkeypatch.setattr(settings, "http2_enabled", False)
+    search_cache.set("LLM", 10, organic_results("recorded LLM", 2))
+    
+    with FakeSerperServer(recordings=load_recordings(search_cache.path)) as server:
+        async with create_http_client() as client:
+            fetcher = NewsFetcher(
+                "test_key",
+                client,
+                rate_limiter=TokenBucket(rate=0, capacity=1),
+                circuit_breaker=CircuitBreaker(failure_threshold=3, reset_timeout=60),
+                use_cache=False
+            )
+            fetcher.base_url = server.url
+            recorded = await fetcher.fetch_news(["LLM"])
+            synthetic = await fetcher.fetch_news(["deep learning"])
+    
+    assert [item.title for item in recorded] == ["recorded LLM result 0", "recorded LLM result 1"]
+    assert len(synthetic) == 10
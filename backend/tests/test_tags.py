@@ -0,0 +1,72 @@
+from datetime import date, datetime, timedelta
+import pytest
+from sqlalchemy import select
+from app.models.news import NewsTermStat
+from app.schemas.news import NewsCreate
+from app.services.news_fetcher import save_news_items
+from app.services.tags import extract_terms, pick_tags, term_counts
+
+
+def _item(url: str, title: str, body: str, source: str = "Source") -> NewsCreate:
+    return NewsCreate(title=title, body=body, summary=body[:200], source=source, url=url, published_at=datetime.now())
+
+
+def test_extract_terms_follows_frontend_rules():
+    terms = extract_terms("OpenAI's new LLM: GPT-4 & the AI race", "An LLM model, 2025 data; data_set")
+    
+    assert terms == {"openai": 1, "llm": 2, "gpt": 1, "model": 1, "data": 1}
+
+
+def test_term_counts_aggregate_per_day_and_source():
+    day = date(2025, 10, 17)
+    counts = term_counts([
+        (day, "a", "LLM news", "llm"),
+        (day, "a", "LLM again", ""),
+        (day, "b", "LLM", ""),
+    ])
+    
+    assert counts == {(day, "a", "llm"): 3, (day, "b", "llm"): 1}
+
+
+def test_pick_tags_returns_common_then_rare_above_min_frequency():
+    frequencies = [(f"term{i}", 20 - i) for i in range(10)] + [("single", 1), ("aaa", 12)]
+    
+    assert pick_tags(frequencies) == ["term0", "term1", "term2", "term3", "term4", "term5", "term6", "term7"]
+    assert pick_tags([("b", 2), ("a", 2), ("c", 1)]) == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_ingest_updates_term_stats_incrementally(async_db_session):
+    await save_news_items(async_db_session, [_item("https://example.com/1", "LLM agents", "An agent uses an LLM")])
+    await save_news_items(async_db_session, [
+        _item("https://example.com/1", "LLM agents", "An agent uses an LLM"),
+        _item("https://example.com/2", "Diffusion", "Diffusion beats the LLM", source="arxiv"),
+    ])
+    
+    rows = (await async_db_session.execute(
+        select(NewsTermStat.source, NewsTermStat.term, NewsTermStat.count)
+        .order_by(NewsTermStat.source, NewsTermStat.term)
+    )).tuples().all()
+    assert rows == [
+        ("Source", "agent", 1),
+        ("Source", "llm", 2),
+        ("arxiv", "diffusion", 2),
+        ("arxiv", "llm", 1),
+    ]
+
+
+def test_get_news_tags(client, db_session):
+    today = datetime.utcnow().date()
+    db_session.add_all([
+        NewsTermStat(day=today, source="a", term="llm", count=4),
+        NewsTermStat(day=today, source="b", term="llm", count=3),
+        NewsTermStat(day=today, source="b", term="agent", count=2),
+        NewsTermStat(day=today, source="b", term="rag", count=1),
+        NewsTermStat(day=today - timedelta(days=30), source="a", term="gpt", count=9),
+    ])
+    db_session.commit()
+    
+    assert client.get("/api/news/tags").json() == {"tags": ["gpt", "llm", "agent"], "counts": {"gpt": 9, "llm": 7, "agent": 2, "rag": 1}}
+    assert client.get("/api/news/tags?days=7").json()["tags"] == ["llm", "agent"]
+    assert client.get("/api/news/tags?source=b").json() == {"tags": ["llm", "agent"], "counts": {"llm": 3, "agent": 2, "rag": 1}}
+    assert client.get("/api/news/tags?days=0").status_code == 422
@@ -1,14 +1,36 @@
-import { NewsArticle } from './types'
+import { ExportMeta, NewsArticle } from './types'
+import metaData from '../public/data/meta.json'
 
 const API_BASE_URL = process.env.NEXT_PUBLIC_API_URL || 'http://localhost:8000'
 const API_TIMEOUT = 3000
+const NEWS_LIMIT = 1000
+
+async function loadStaticNews(): Promise<NewsArticle[]> {
+    const shards = (metaData as ExportMeta).shards ?? [];
+
+    if (shards.length === 0) {
+        const newsData = await import('../public/data/news.json');
+        return Array.isArray(newsData.default) ? newsData.default as NewsArticle[] : [];
+    }
+
+    const articles: NewsArticle[] = [];
+    for (const shard of shards) {
+        if (articles.length >= NEWS_LIMIT) break;
+        const name = shard.file.split('/').pop()!.replace(/\.json$/, '');
+        const page = await import(`../public/data/news/${name}.json`);
+        if (Array.isArray(page.default)) {
+            articles.push(...page.default as NewsArticle[]);
+        }
+    }
+    return articles.slice(0, NEWS_LIMIT);
+}
 
 export async function fetchNewsWithFallback(): Promise<NewsArticle[]> {
     try {
         const controller = new AbortController();
         const timeoutId = setTimeout(() => controller.abort(), API_TIMEOUT);
 
-        const response = await fetch(`${API_BASE_URL}/api/news?limit=1000`, {
+        const response = await fetch(`${API_BASE_URL}/api/news?limit=${NEWS_LIMIT}`, {
             signal: controller.signal,
             headers: {
                 'Content-Type': 'application/json',
@@ -35,8 +57,7 @@ export async function fetchNewsWithFallback(): Promise<NewsArticle[]> {
         }
 
         try {
-            const newsData = await import('../public/data/news.json');
-            return Array.isArray(newsData.default) ? newsData.default as NewsArticle[] : [];
+            return await loadStaticNews();
         } catch (fallbackError) {
             console.error('Failed to load fallback data:', fallbackError);
             return [];
@@ -60,3 +81,25 @@ export async function checkApiHealth(): Promise<boolean> {
     }
 }
 
+
+export async function fetchTermCounts(): Promise<Record<string, number> | null> {
+    try {
+        const controller = new AbortController();
+        const timeoutId = setTimeout(() => controller.abort(), API_TIMEOUT);
+
+        const response = await fetch(`${API_BASE_URL}/api/news/tags`, {
+            signal: controller.signal,
+        });
+
+        clearTimeout(timeoutId);
+
+        if (!response.ok) {
+            return null;
+        }
+
+        const data = await response.json();
+        return data.counts && Object.keys(data.counts).length > 0 ? data.counts : null;
+    } catch {
+        return null;
+    }
+}
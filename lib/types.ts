@@ -16,3 +16,17 @@ export interface NewsArticle {
     from_serper?: boolean | null
 }
 
+
+export interface SnapshotShard {
+    file: string
+    count: number
+    day?: string
+}
+
+export interface ExportMeta {
+    last_updated?: string
+    count?: number
+    files?: string[]
+    shard_mode?: string
+    shards?: SnapshotShard[]
+}
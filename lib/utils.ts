@@ -1,7 +1,7 @@
 import { NewsArticle } from './types'
 import { AI_WORDS, STOP_WORDS, MIN_WORD_LENGTH, MIN_WORD_FREQUENCY } from './constants'
 
-export function extractTags(articles: NewsArticle[]): string[] {
+export function countTerms(articles: NewsArticle[]): Map<string, number> {
     const wordFrequency = new Map<string, number>()
 
     articles.forEach(article => {
@@ -20,6 +20,10 @@ export function extractTags(articles: NewsArticle[]): string[] {
         })
     })
 
+    return wordFrequency
+}
+
+export function pickTags(wordFrequency: Map<string, number>): string[] {
     const sorted = Array.from(wordFrequency.entries())
         .filter(([, frequency]) => frequency >= MIN_WORD_FREQUENCY)
         .sort((a, b) => b[1] - a[1])
@@ -29,3 +33,7 @@ export function extractTags(articles: NewsArticle[]): string[] {
     return [...common, ...rare]
 }
 
+export function extractTags(articles: NewsArticle[]): string[] {
+    return pickTags(countTerms(articles))
+}
+